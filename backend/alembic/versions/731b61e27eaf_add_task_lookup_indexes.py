@@ -0,0 +1,57 @@
+"""Add task lookup indexes
+
+Revision ID: 731b61e27eaf
+Revises: 2c45598d0a4f
+Create Date: 2026-10-16 10:12:31.412907
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "731b61e27eaf"
+down_revision = "2c45598d0a4f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build the indexes without locking writes on the tasks table;
+    # CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        # Task lists filter by user, plus status (active/snoozed) or source
+        op.create_index(
+            "idx_tasks_user_status",
+            "tasks",
+            ["user_id", "status"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_tasks_user_source",
+            "tasks",
+            ["user_id", "source"],
+            postgresql_concurrently=True,
+        )
+        # Looking up the tasks generated from an image
+        op.create_index(
+            "idx_tasks_source_image_id",
+            "tasks",
+            ["source_image_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_tasks_source_image_id",
+            table_name="tasks",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_tasks_user_source", table_name="tasks", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "idx_tasks_user_status", table_name="tasks", postgresql_concurrently=True
+        )
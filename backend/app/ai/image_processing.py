@@ -200,12 +200,12 @@ class ImageProcessingService:
             ImageProcessingError: If processing fails after all retries
             ImageValidationError: If image validation fails
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         retry_count = 0
 
         try:
             # Step 1: Validate and preprocess image
-            logger.info(f"Starting image analysis for user {user_id}")
+            logger.info("Starting image analysis for user %s", user_id)
 
             try:
                 (
@@ -223,7 +223,9 @@ class ImageProcessingService:
                 )
 
                 logger.info(
-                    f"Image preprocessed: {metadata['original_size']} -> {metadata['processed_size']} bytes"
+                    "Image preprocessed: %s -> %s bytes",
+                    metadata["original_size"],
+                    metadata["processed_size"],
                 )
             except ImageValidationError as e:
                 # Log validation failure
@@ -265,14 +267,17 @@ class ImageProcessingService:
                 )
 
             # Step 3: Process results
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
 
             if analysis_result:
                 tasks = analysis_result.get("tasks", [])
                 # Log task confidence values for debugging
                 for i, task in enumerate(tasks):
                     logger.info(
-                        f"Task {i}: '{task.get('title', 'Unknown')}' has confidence: {task.get('confidence', 'MISSING')}"
+                        "Task %d: '%s' has confidence: %s",
+                        i,
+                        task.get("title", "Unknown"),
+                        task.get("confidence", "MISSING"),
                     )
 
                 result = {
@@ -306,7 +311,9 @@ class ImageProcessingService:
             )
 
             logger.info(
-                f"Image analysis completed in {processing_time:.2f}s with {len(result['tasks'])} tasks"
+                "Image analysis completed in %.2fs with %d tasks",
+                processing_time,
+                len(result["tasks"]),
             )
             return result
 
@@ -314,7 +321,7 @@ class ImageProcessingService:
             # Re-raise validation errors without wrapping
             raise
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
 
             # Log pipeline failure
             self.processing_logger.log_processing_pipeline_complete(
@@ -351,7 +358,9 @@ class ImageProcessingService:
 
         for attempt in range(self.max_retries + 1):  # +1 for initial attempt
             try:
-                logger.info(f"AI analysis attempt {attempt + 1}/{self.max_retries + 1}")
+                logger.info(
+                    "AI analysis attempt %d/%d", attempt + 1, self.max_retries + 1
+                )
                 result = await self.ai_provider.analyze_image(image_data, prompt)
                 result["retry_count"] = attempt
                 return result
@@ -635,6 +644,6 @@ class ImageProcessingService:
         )
 
         logger.info(
-            f"Created {len(created_tasks)} tasks from AI analysis for user {user_id}"
+            "Created %d tasks from AI analysis for user %s", len(created_tasks), user_id
         )
         return created_tasks
@@ -122,7 +122,7 @@ class PromptTester:
             Test result with evaluation metrics
         """
         test_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             # Get test image and metadata
@@ -150,7 +150,7 @@ class PromptTester:
 
             # Run AI analysis
             ai_response = await self.ai_provider.analyze_image(image_data, prompt)
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
 
             # Evaluate results
             evaluation = self._evaluate_response(ai_response, metadata)
@@ -196,7 +196,7 @@ class PromptTester:
             return result
 
         except Exception as e:
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             error_msg = str(e)
 
             # Log failed test
@@ -1,11 +1,11 @@
 """AI provider interface and implementations."""
 
-import json
 import time
 import uuid
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List, Union
 import logging
+import orjson
 from pydantic import BaseModel, Field
 
 from ..logging_config import AIProviderLogger
@@ -187,13 +187,13 @@ class GeminiProvider(AIProvider):
             AIProviderAPIError: If API returns an error
         """
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Update request metrics
         requests_made = self._usage_metrics["requests_made"]
         if isinstance(requests_made, int):
             self._usage_metrics["requests_made"] = requests_made + 1
-        self._usage_metrics["last_request_time"] = start_time
+        self._usage_metrics["last_request_time"] = time.time()
 
         # Log request start
         self.provider_logger.log_request(
@@ -217,7 +217,7 @@ class GeminiProvider(AIProvider):
             result = self._parse_response(response)
 
             # Calculate processing time
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             response_times = self._usage_metrics["response_times"]
             if isinstance(response_times, list):
                 response_times.append(processing_time)
@@ -269,7 +269,7 @@ class GeminiProvider(AIProvider):
             if isinstance(failed_requests, int):
                 self._usage_metrics["failed_requests"] = failed_requests + 1
 
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             response_times = self._usage_metrics["response_times"]
             if isinstance(response_times, list):
                 response_times.append(processing_time)
@@ -428,12 +428,11 @@ class GeminiProvider(AIProvider):
 
             # With structured output, we should get clean JSON
             try:
-                parsed_data = json.loads(response_text)
-                # Log the raw response to debug confidence scores
-                logger.info(
-                    f"Gemini raw response: {json.dumps(parsed_data, indent=2)[:1000]}..."
-                )
-            except json.JSONDecodeError as e:
+                parsed_data = orjson.loads(response_text)
+                # Log the raw response to debug confidence scores; the text is
+                # already JSON, so it isn't re-encoded just for the log line
+                logger.debug("Gemini raw response: %s...", response_text[:1000])
+            except orjson.JSONDecodeError as e:
                 logger.error(
                     f"Failed to parse JSON from Gemini structured response: {e}"
                 )
@@ -589,13 +588,13 @@ class MockProvider(AIProvider):
     async def analyze_image(self, image_data: bytes, prompt: str) -> Dict[str, Any]:
         """Return mock analysis results."""
         request_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Update metrics
         requests_made = self._usage_metrics["requests_made"]
         if isinstance(requests_made, int):
             self._usage_metrics["requests_made"] = requests_made + 1
-        self._usage_metrics["last_request_time"] = start_time
+        self._usage_metrics["last_request_time"] = time.time()
 
         self.provider_logger.log_request(
             request_id=request_id,
@@ -620,10 +619,10 @@ class MockProvider(AIProvider):
                 response_data = self.mock_responses[0]
 
             # Deep copy to avoid modifying the template
-            result = json.loads(json.dumps(response_data))
+            result = orjson.loads(orjson.dumps(response_data))
 
             # Add mock metadata
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             result.update(
                 {
                     "provider": self.get_provider_name(),
@@ -661,7 +660,7 @@ class MockProvider(AIProvider):
             if isinstance(failed_requests, int):
                 self._usage_metrics["failed_requests"] = failed_requests + 1
 
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             self.provider_logger.log_error(
                 request_id=request_id,
                 model="mock",
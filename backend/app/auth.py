@@ -1,5 +1,6 @@
 from typing import Optional, Dict
 from datetime import datetime, timezone
+from functools import lru_cache
 from fastapi import HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi_nextauth_jwt import NextAuthJWT  # type: ignore
@@ -10,10 +11,24 @@ import os
 import json
 from .database import get_session_dependency, User as UserModel
 import hashlib
+import logging
 from .logging_config import StructuredLogger
 
 logger = StructuredLogger(__name__)
 
+# Namespace for deriving stable user UUIDs from emails (uuid.NAMESPACE_DNS)
+_USER_ID_NAMESPACE = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
+
+
+@lru_cache(maxsize=4096)
+def _parse_user_uuid(user_id: str) -> Optional[uuid.UUID]:
+    """Parse a token subject as a UUID once per distinct value; None if it isn't one."""
+    try:
+        return uuid.UUID(user_id)
+    except (ValueError, TypeError):
+        return None
+
+
 # Environment helpers
 def _is_development() -> bool:
     env = (os.getenv("ENV") or os.getenv("NODE_ENV") or "").lower()
@@ -101,7 +116,6 @@ async def get_current_user(
     Get the current authenticated user from NextAuth JWT token.
     Token should be passed via Authorization Bearer header.
     """
-
     if not credentials or not credentials.credentials:
         logger.error("No credentials provided in request")
         raise HTTPException(
@@ -110,20 +124,25 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Log secret diagnostics at request time to verify runtime value
-    if _is_development():
-        try:
-            _prefix = hashlib.sha256(AUTH_SECRET.encode("utf-8")).hexdigest()[:12]
-            logger.info(
-                "Auth attempt secret check",
-                sha256_prefix=_prefix,
-                length=len(AUTH_SECRET),
-            )
-        except Exception:
-            pass
+    # Per-request auth diagnostics run on every authenticated call, so they
+    # are only built when debug logging is enabled
+    if logger.is_enabled_for(logging.DEBUG):
+        if _is_development():
+            try:
+                _prefix = hashlib.sha256(AUTH_SECRET.encode("utf-8")).hexdigest()[:12]
+                logger.debug(
+                    "Auth attempt secret check",
+                    sha256_prefix=_prefix,
+                    length=len(AUTH_SECRET),
+                )
+            except Exception:
+                pass
 
-    logger.info(f"Auth attempt with token length: {len(credentials.credentials)}")
-    logger.debug(f"Token preview: {credentials.credentials[:50]}...")
+        logger.debug(
+            "Auth attempt",
+            token_length=len(credentials.credentials),
+            token_preview=f"{credentials.credentials[:50]}...",
+        )
 
     try:
         # Use fastapi-nextauth-jwt to decrypt the token
@@ -132,7 +151,7 @@ async def get_current_user(
 
         # Now use the library to decrypt
         token_data = nextauth(mock_request)
-        logger.info(f"Successfully decrypted NextAuth token for: {token_data.get('email')}")
+        logger.debug("Decrypted NextAuth token", email=token_data.get("email"))
 
     except Exception as e:
         logger.warning(f"NextAuth JWT decryption failed: {str(e)}")
@@ -166,12 +185,10 @@ async def get_current_user(
             )
 
         # Validate user_id is a valid UUID or generate one
-        try:
-            user_uuid = uuid.UUID(user_id)
-        except (ValueError, TypeError):
+        user_uuid = _parse_user_uuid(user_id)
+        if user_uuid is None:
             # Generate UUID from email for non-UUID OAuth IDs
-            namespace_uuid = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")
-            user_uuid = uuid.uuid5(namespace_uuid, user_email)
+            user_uuid = uuid.uuid5(_USER_ID_NAMESPACE, user_email)
             logger.info(
                 "Generated UUID for non-UUID user ID",
                 original_id=user_id,
@@ -245,7 +262,7 @@ async def get_current_user(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error("Unexpected error in get_current_user", error=str(e))
+        logger.exception("Unexpected error in get_current_user", error=str(e))
         raise HTTPException(status_code=401, detail="Authentication failed")
 
 
@@ -54,6 +54,17 @@ class DatabaseConfig(BaseSettings):
     pool_size: int = Field(default=10, description="Connection pool size")
     max_overflow: int = Field(default=20, description="Maximum pool overflow")
     pool_pre_ping: bool = Field(default=True, description="Enable pool pre-ping")
+    pool_recycle: int = Field(
+        default=1800, description="Seconds before a pooled connection is recycled"
+    )
+    pool_timeout: int = Field(
+        default=30, description="Seconds to wait for a free pooled connection"
+    )
+    transaction_pooler: bool = Field(
+        default=False,
+        description="Database is reached through a transaction-mode pooler "
+        "(pgbouncer, Supavisor port 6543)",
+    )
     echo: bool = Field(default=False, description="Enable SQL logging")
 
 
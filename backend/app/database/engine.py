@@ -5,6 +5,7 @@ from sqlalchemy.pool import NullPool
 from sqlalchemy.engine.url import make_url
 from ..config import config
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +13,11 @@ logger = logging.getLogger(__name__)
 _engine: AsyncEngine | None = None
 
 
+def _json_serializer(value: object) -> str:
+    """Encode JSON column values with orjson instead of the stdlib encoder."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def create_engine() -> AsyncEngine:
     """
     Create and configure SQLAlchemy async engine.
@@ -39,16 +45,32 @@ def create_engine() -> AsyncEngine:
     # Create engine with appropriate settings
     engine_kwargs = {
         "echo": config.database.echo,
+        # JSON columns (schedule, content, metrics, ...) are encoded and
+        # decoded in one native pass
+        "json_serializer": _json_serializer,
+        "json_deserializer": orjson.loads,
     }
 
     if is_sqlite:
         # SQLite doesn't support connection pooling parameters
         engine_kwargs["poolclass"] = NullPool
+    elif config.database.transaction_pooler:
+        # The external pooler owns the connections, and a server connection
+        # can change between transactions, so asyncpg's prepared statements
+        # must stay off
+        engine_kwargs["poolclass"] = NullPool
+        engine_kwargs["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+        }
     else:
         # PostgreSQL/other databases support connection pooling
         engine_kwargs["pool_size"] = config.database.pool_size
         engine_kwargs["max_overflow"] = config.database.max_overflow
         engine_kwargs["pool_pre_ping"] = config.database.pool_pre_ping
+        engine_kwargs["pool_timeout"] = config.database.pool_timeout
+        # Replace connections before the hosting proxy silently drops them
+        engine_kwargs["pool_recycle"] = config.database.pool_recycle
         # Use NullPool for testing environments to avoid connection issues
         if "test" in config.database.database_url:
             engine_kwargs["poolclass"] = NullPool
@@ -30,31 +30,23 @@ def get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
-@asynccontextmanager
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_session_dependency() -> AsyncGenerator[AsyncSession, None]:
     """
-    Get a database session with automatic cleanup.
+    FastAPI dependency for database sessions.
+
+    Rolls back on error; the session's own context manager closes it on exit.
 
     Yields:
         Database session
     """
-    session_factory = get_session_factory()
-    async with session_factory() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 
-async def get_session_dependency() -> AsyncGenerator[AsyncSession, None]:
-    """
-    FastAPI dependency for database sessions.
-
-    Yields:
-        Database session
-    """
-    async with get_session() as session:
-        yield session
+# The same session lifecycle as an ``async with`` context manager, for use
+# outside request handlers
+get_session = asynccontextmanager(get_session_dependency)
@@ -72,7 +72,7 @@ async def _process_image_analysis(
     processing_service = create_image_processing_service()
 
     # Process and validate image first
-    logger.info(f"Starting image analysis for user {user_id}, file: {filename}")
+    logger.info("Starting image analysis for user %s, file: %s", user_id, filename)
 
     try:
         analysis_result = await processing_service.analyze_image_and_generate_tasks(
@@ -158,7 +158,7 @@ async def _create_tasks_from_analysis(
                 analysis_result=analysis_result,
             )
 
-        logger.info(f"Created {created_count} tasks from image analysis")
+        logger.info("Created %d tasks from image analysis", created_count)
 
     except Exception as e:
         logger.error(f"Failed to create tasks from analysis: {e}")
@@ -220,12 +220,15 @@ def _build_analysis_response(
     # Convert tasks to response format
     generated_tasks = []
     logger.info(
-        f"Building response from analysis result with {len(analysis_result.get('tasks', []))} tasks"
+        "Building response from analysis result with %d tasks",
+        len(analysis_result.get("tasks", [])),
     )
     for task_data in analysis_result.get("tasks", []):
         task_confidence = task_data.get("confidence", 0.5)
         logger.info(
-            f"Task '{task_data.get('title', 'Unknown')}' has confidence: {task_confidence}"
+            "Task '%s' has confidence: %s",
+            task_data.get("title", "Unknown"),
+            task_confidence,
         )
         generated_task = GeneratedTask(
             title=task_data.get("title", "Untitled task"),
@@ -329,7 +332,9 @@ async def analyze_image(
     )
 
     logger.info(
-        f"Detected locale: {detected_locale} from source: {locale_metadata.get('source')}"
+        "Detected locale: %s from source: %s",
+        detected_locale,
+        locale_metadata.get("source"),
     )
 
     # Validate file upload
@@ -368,9 +373,13 @@ async def analyze_image(
 
     # Log locale detection for monitoring
     logger.info(
-        f"Image analysis request - User: {current_user.id}, Locale: {detected_locale}, "
-        f"Locale source: {locale_metadata.get('source')}, "
-        f"Accept-Language: {accept_language}, File: {image.filename}"
+        "Image analysis request - User: %s, Locale: %s, "
+        "Locale source: %s, Accept-Language: %s, File: %s",
+        current_user.id,
+        detected_locale,
+        locale_metadata.get("source"),
+        accept_language,
+        image.filename,
     )
 
     try:
@@ -385,7 +394,9 @@ async def analyze_image(
             session=session,
         )
 
-        logger.info(f"Image analysis completed successfully for user {current_user.id}")
+        logger.info(
+            "Image analysis completed successfully for user %s", current_user.id
+        )
         return response
 
     except ImageValidationError as e:
@@ -107,20 +107,20 @@ def detect_locale_from_header(accept_language_header: Optional[str]) -> str:
         for locale, _ in parsed_locales:
             normalized_locale = locale.lower()
             if is_supported_locale(normalized_locale):
-                logger.debug(f"Found exact locale match: {normalized_locale}")
+                logger.debug("Found exact locale match: %s", normalized_locale)
                 return normalized_locale
 
         # Then, try to match by language code only
         for locale, _ in parsed_locales:
             language_code = extract_language_code(locale)
             if is_supported_locale(language_code):
-                logger.debug(f"Found language code match: {language_code}")
+                logger.debug("Found language code match: %s", language_code)
                 return language_code
 
     except Exception as e:
         logger.warning(f"Failed to parse Accept-Language header: {e}")
 
-    logger.debug(f"No supported locale found, using default: {DEFAULT_LOCALE}")
+    logger.debug("No supported locale found, using default: %s", DEFAULT_LOCALE)
     return DEFAULT_LOCALE
 
 
@@ -144,7 +144,7 @@ async def get_user_locale_preference(
         preference = result.scalar_one_or_none()
 
         if preference and is_supported_locale(preference):
-            logger.debug(f"Found user locale preference: {preference}")
+            logger.debug("Found user locale preference: %s", preference)
             return preference
         elif preference:
             logger.warning(f"User has unsupported locale preference: {preference}")
@@ -284,9 +284,9 @@ async def set_user_locale_preference(
         # Let the caller handle the commit
 
         if locale is None:
-            logger.info(f"Cleared locale preference for user {user_id}")
+            logger.info("Cleared locale preference for user %s", user_id)
         else:
-            logger.info(f"Set locale preference for user {user_id}: {locale}")
+            logger.info("Set locale preference for user %s: %s", user_id, locale)
         return True
 
     except SQLAlchemyError as e:
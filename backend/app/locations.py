@@ -2,11 +2,12 @@
 
 import logging
 import uuid
-from typing import List
-from datetime import datetime
+from typing import Any, Dict, List
+from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, and_
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .database import get_session_dependency, User as UserModel
@@ -19,12 +20,48 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/locations", tags=["locations"])
 
+# Virtual default locations don't depend on DB state, so their fields are
+# built once at import and only stamped with the user's id per request.
+_DEFAULT_TS = datetime.now(timezone.utc)
+_DEFAULT_PROTOS: List[Dict[str, Any]] = [
+    {
+        "name": name,
+        "description": None,
+        "is_active": True,
+        "is_default": True,
+        "is_from_defaults": True,
+        "location_metadata": None,
+    }
+    for name in app_config.default_locations
+]
+
+# List statements are built once and bound per request; saved locations come
+# back custom ones first, then used defaults, each group sorted by name.
+_LIST_STMT = (
+    select(LocationModel)
+    .where(LocationModel.user_id == bindparam("uid"))
+    .order_by(LocationModel.is_default, LocationModel.name)
+)
+_LIST_ACTIVE_STMT = _LIST_STMT.where(LocationModel.is_active)
+
 
 def get_user_id(current_user: UserModel = Depends(get_current_user)) -> uuid.UUID:
     """Get the user's UUID from the authenticated user."""
     return current_user.id
 
 
+async def _get_user_location_or_404(
+    session: AsyncSession, location_id: uuid.UUID, user_id: uuid.UUID
+) -> LocationModel:
+    """Fetch a location by primary key and ensure it belongs to the user."""
+    location = await session.get(LocationModel, location_id)
+
+    if not location or location.user_id != user_id:
+        raise HTTPException(status_code=404, detail="Location not found")
+
+    return location
+
+
 @router.post("/", response_model=Location, status_code=201)
 async def create_location(
     location: LocationCreate,
@@ -40,12 +77,15 @@ async def create_location(
 
     db_location = LocationModel(user_id=user_id, **location_data)
 
+    # Load server-generated columns before committing, so the commit hands the
+    # connection back to the pool before the response is built
     session.add(db_location)
-    await session.commit()
+    await session.flush()
     await session.refresh(db_location)
+    await session.commit()
 
-    logger.info(f"Created location {db_location.id} for user {user_id}")
-    return Location.model_validate(db_location)
+    logger.info("Created location %s for user %s", db_location.id, user_id)
+    return Location.from_db_row(db_location)
 
 
 @router.get("/", response_model=List[Location])
@@ -55,12 +95,8 @@ async def list_locations(
     session: AsyncSession = Depends(get_session_dependency),
 ):
     """List all locations for the user, including defaults not yet saved."""
-    query = select(LocationModel).where(LocationModel.user_id == user_id)
-
-    if active_only:
-        query = query.where(LocationModel.is_active)
-
-    result = await session.execute(query)
+    stmt = _LIST_ACTIVE_STMT if active_only else _LIST_STMT
+    result = await session.execute(stmt, {"uid": user_id})
     db_locations = result.scalars().all()
 
     # Convert to Location models
@@ -68,34 +104,36 @@ async def list_locations(
     saved_location_names = set()
 
     # First add all user's saved locations (custom ones first, then used defaults)
-    for db_loc in sorted(db_locations, key=lambda x: (x.is_default, x.name)):
-        loc = Location.model_validate(db_loc)
-        loc.is_from_defaults = db_loc.is_default
-        locations.append(loc)
+    for db_loc in db_locations:
+        locations.append(
+            Location.from_db_row(db_loc, is_from_defaults=db_loc.is_default)
+        )
         saved_location_names.add(db_loc.name)
 
     # Then add any default locations that haven't been used yet
-    for default_name in app_config.default_locations:
-        if default_name not in saved_location_names:
-            # Create a virtual location for display
-            virtual_location = Location(
-                id=uuid.uuid4(),  # Temporary ID for frontend
-                user_id=user_id,
-                name=default_name,
-                description=None,
-                is_active=True,
-                is_default=True,
-                is_from_defaults=True,
-                location_metadata=None,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+    for proto in _DEFAULT_PROTOS:
+        if proto["name"] not in saved_location_names:
+            # Virtual location for display, with an ID that is stable per user
+            locations.append(
+                Location.model_construct(
+                    id=uuid.uuid5(uuid.NAMESPACE_OID, f"{user_id}:{proto['name']}"),
+                    user_id=user_id,
+                    created_at=_DEFAULT_TS,
+                    updated_at=_DEFAULT_TS,
+                    **proto,
+                )
             )
-            locations.append(virtual_location)
 
     logger.info(
-        f"Retrieved {len(locations)} locations for user {user_id} ({len(db_locations)} saved, {len(locations) - len(db_locations)} defaults)"
+        "Retrieved %d locations for user %s (%d saved, %d defaults)",
+        len(locations),
+        user_id,
+        len(db_locations),
+        len(locations) - len(db_locations),
     )
-    return locations
+    # Serialize once here; returning a Response skips FastAPI's response_model
+    # validation and jsonable_encoder pass over every location
+    return ORJSONResponse([loc.model_dump(mode="json") for loc in locations])
 
 
 @router.get("/{location_id}", response_model=Location)
@@ -105,17 +143,9 @@ async def get_location(
     session: AsyncSession = Depends(get_session_dependency),
 ):
     """Get a specific location by ID."""
-    query = select(LocationModel).where(
-        and_(LocationModel.id == location_id, LocationModel.user_id == user_id)
-    )
-
-    result = await session.execute(query)
-    location = result.scalar_one_or_none()
+    location = await _get_user_location_or_404(session, location_id, user_id)
 
-    if not location:
-        raise HTTPException(status_code=404, detail="Location not found")
-
-    return Location.model_validate(location)
+    return Location.from_db_row(location)
 
 
 @router.patch("/{location_id}", response_model=Location)
@@ -126,26 +156,19 @@ async def update_location(
     session: AsyncSession = Depends(get_session_dependency),
 ):
     """Update an existing location."""
-    query = select(LocationModel).where(
-        and_(LocationModel.id == location_id, LocationModel.user_id == user_id)
-    )
-
-    result = await session.execute(query)
-    location = result.scalar_one_or_none()
-
-    if not location:
-        raise HTTPException(status_code=404, detail="Location not found")
+    location = await _get_user_location_or_404(session, location_id, user_id)
 
     # Update only provided fields
     update_data = location_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(location, field, value)
 
-    await session.commit()
+    await session.flush()
     await session.refresh(location)
+    await session.commit()
 
-    logger.info(f"Updated location {location_id} for user {user_id}")
-    return Location.model_validate(location)
+    logger.info("Updated location %s for user %s", location_id, user_id)
+    return Location.from_db_row(location)
 
 
 @router.delete("/{location_id}", status_code=204)
@@ -155,19 +178,11 @@ async def delete_location(
     session: AsyncSession = Depends(get_session_dependency),
 ):
     """Delete a location (soft delete by setting is_active to False)."""
-    query = select(LocationModel).where(
-        and_(LocationModel.id == location_id, LocationModel.user_id == user_id)
-    )
-
-    result = await session.execute(query)
-    location = result.scalar_one_or_none()
-
-    if not location:
-        raise HTTPException(status_code=404, detail="Location not found")
+    location = await _get_user_location_or_404(session, location_id, user_id)
 
     # Soft delete - just mark as inactive
     location.is_active = False
     await session.commit()
 
-    logger.info(f"Deleted location {location_id} for user {user_id}")
+    logger.info("Deleted location %s for user %s", location_id, user_id)
     return
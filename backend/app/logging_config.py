@@ -2,15 +2,20 @@
 
 import json
 import logging
+import queue
 import sys
 import uuid
+from logging.handlers import QueueHandler, QueueListener
 from contextvars import ContextVar
-from typing import Optional
+from typing import Any, Optional
 from datetime import datetime, timezone
 
 # Context variable for correlation ID
 correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
 
+# Background listener draining queued log records (set up by setup_logging)
+_queue_listener: Optional[QueueListener] = None
+
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging."""
@@ -19,7 +24,9 @@ class StructuredFormatter(logging.Formatter):
         """Format log record as structured JSON."""
         # Base log structure
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc)
+            .isoformat()
+            .replace("+00:00", "Z"),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -28,8 +35,8 @@ class StructuredFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add correlation ID if available
-        corr_id = correlation_id.get()
+        # Add correlation ID if available (captured on the record when queued)
+        corr_id = getattr(record, "correlation_id", None) or correlation_id.get()
         if corr_id:
             log_entry["correlation_id"] = corr_id
 
@@ -56,13 +63,21 @@ class StructuredLogger:
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
 
-    def _log_with_extra(self, level: int, message: str, **kwargs) -> None:
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a message at ``level`` would be emitted."""
+        return self.logger.isEnabledFor(level)
+
+    def _log_with_extra(
+        self, level: int, message: str, *, exc_info: Any = None, **kwargs
+    ) -> None:
         """
         Log a message with additional structured fields.
 
         Args:
             level (int): The logging level (e.g., logging.INFO, logging.ERROR).
             message (str): The log message.
+            exc_info: Exception info to attach to the record. The traceback is
+                only formatted if a handler actually emits the record.
             **kwargs: Additional fields to include in the log entry. Fields with a value of `None`
                 will be filtered out and not included in the log.
 
@@ -74,7 +89,11 @@ class StructuredLogger:
         if not self.logger.isEnabledFor(level):
             return
 
-        extra_fields = {k: v for k, v in kwargs.items() if v is not None}
+        # kwargs is already a fresh dict; only rebuild it when there is
+        # something to strip
+        extra_fields = kwargs
+        if None in kwargs.values():
+            extra_fields = {k: v for k, v in kwargs.items() if v is not None}
 
         # Create a custom LogRecord with extra fields
         record = self.logger.makeRecord(
@@ -84,7 +103,7 @@ class StructuredLogger:
             lno=0,
             msg=message,
             args=(),
-            exc_info=None,
+            exc_info=exc_info,
         )
         record.extra_fields = extra_fields
 
@@ -106,15 +125,45 @@ class StructuredLogger:
         """Log debug message with structured data."""
         self._log_with_extra(logging.DEBUG, message, **kwargs)
 
+    def exception(self, message: str, **kwargs) -> None:
+        """Log error message with the current exception's traceback attached."""
+        self._log_with_extra(logging.ERROR, message, exc_info=sys.exc_info(), **kwargs)
+
+
+class _LocalQueueHandler(QueueHandler):
+    """QueueHandler for a listener running in the same process.
+
+    The message is merged with its arguments here, as the stdlib handler
+    does, so mutable arguments are logged as they were at the call. Unlike
+    the stdlib handler, ``exc_info`` and ``extra_fields`` are kept for the
+    listener's formatter. The correlation ID is captured here too, since the
+    context variable isn't visible from the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if not hasattr(record, "correlation_id"):
+            record.correlation_id = correlation_id.get()
+        return record
+
 
-def setup_logging(log_level: str = "INFO", enable_json: bool = True) -> None:
+def setup_logging(
+    log_level: str = "INFO", enable_json: bool = True, use_queue: bool = False
+) -> None:
     """
     Configure structured logging for the application.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         enable_json: Whether to use JSON formatting
+        use_queue: Hand records to a background QueueListener so formatting
+            and stdout writes happen off the calling (event loop) thread.
+            Call stop_logging() on shutdown to flush pending records.
     """
+    global _queue_listener
+    stop_logging()
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
@@ -135,13 +184,41 @@ def setup_logging(log_level: str = "INFO", enable_json: bool = True) -> None:
         )
         console_handler.setFormatter(formatter)
 
-    root_logger.addHandler(console_handler)
+    if use_queue:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root_logger.addHandler(_LocalQueueHandler(log_queue))
+        _queue_listener = QueueListener(
+            log_queue, console_handler, respect_handler_level=True
+        )
+        _queue_listener.start()
+    else:
+        root_logger.addHandler(console_handler)
 
     # Set specific logger levels
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
     logging.getLogger("fastapi").setLevel(logging.WARNING)
 
 
+def stop_logging() -> None:
+    """
+    Stop the background log listener, flushing any queued records.
+
+    The listener's handlers are attached back to the root logger in place of
+    the queue handler, so records logged after shutdown are still written
+    rather than piling up in a queue nobody drains.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            if isinstance(handler, _LocalQueueHandler):
+                root_logger.removeHandler(handler)
+        for handler in _queue_listener.handlers:
+            root_logger.addHandler(handler)
+        _queue_listener = None
+
+
 def generate_correlation_id() -> str:
     """Generate a unique correlation ID for request tracking."""
     return str(uuid.uuid4())
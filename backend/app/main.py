@@ -1,50 +1,91 @@
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, PlainTextResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
 from sqlalchemy import text
-from .database import get_session
+from .database import close_engine, get_engine
 from .tasks import router as tasks_router
 from .images import router as images_router
 from .locations import router as locations_router
 from .user_settings import router as user_settings_router
-from .logging_config import setup_logging
+from .logging_config import setup_logging, stop_logging
+from .middleware import AppCORSMiddleware
 from .auth import log_secret_diagnostics
+from .config import config
+import asyncio
 import os
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 # Initialize structured logging
 setup_logging(
     log_level=os.getenv("LOG_LEVEL", "INFO"),
     enable_json=os.getenv("ENABLE_JSON_LOGGING", "true").lower() == "true",
+    use_queue=True,
 )
 
-app = FastAPI(title="todo.house API", version="1.0.0")
 
-# CORS configuration
-CORS_ORIGINS = (
-    os.getenv("CORS_ORIGINS", "").split(",") if os.getenv("CORS_ORIGINS") else []
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Startup stays light so the server binds its port quickly; the database
+    # is connected lazily on first use
+    try:
+        # Log auth secret diagnostics at startup
+        log_secret_diagnostics()
+    except Exception:
+        pass
+
+    try:
+        yield
+    finally:
+        await close_engine()
+        stop_logging()
+
+
+app = FastAPI(
+    title="todo.house API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-# Default origins for local development
-if not CORS_ORIGINS:
-    CORS_ORIGINS = ["http://localhost:3000", "http://127.0.0.1:3000"]
 
-# Add production domains
-CORS_ORIGINS.extend(
-    [
-        "https://dev.todo.house",
-        "https://todo.house",
-        "https://www.todo.house",
+# CORS configuration
+def _build_cors_origins() -> List[str]:
+    """Read CORS_ORIGINS from the environment once and add the known domains."""
+    configured = [
+        origin.strip()
+        for origin in os.environ.get("CORS_ORIGINS", "").split(",")
+        if origin.strip()
     ]
-)
 
-# Support Railway PR preview environments
-# Railway PR environments follow pattern: https://*.up.railway.app
-CORS_ORIGINS.append("https://*.up.railway.app")
+    # Default origins for local development
+    if not configured:
+        configured = ["http://localhost:3000", "http://127.0.0.1:3000"]
+
+    # Add production domains
+    configured.extend(
+        [
+            "https://dev.todo.house",
+            "https://todo.house",
+            "https://www.todo.house",
+        ]
+    )
+
+    # Railway PR preview environments (https://*.up.railway.app) are matched
+    # by allow_origin_regex below, since wildcards aren't valid exact origins
+    return list(dict.fromkeys(configured))
+
+
+CORS_ORIGINS = _build_cors_origins()
+
+# Same-origin infrastructure endpoints that never need CORS headers
+CORS_EXEMPT_PATHS = ("/", "/api/health", "/api/health/live", "/robots.txt")
 
 # CORS middleware for Next.js frontend
 app.add_middleware(
-    CORSMiddleware,
+    AppCORSMiddleware,
+    exempt_paths=CORS_EXEMPT_PATHS,
     allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
@@ -58,42 +99,58 @@ app.include_router(images_router)
 app.include_router(locations_router)
 app.include_router(user_settings_router)
 
-# Log auth secret diagnostics at startup
-@app.on_event("startup")
-async def _log_auth_secret():
-    try:
-        log_secret_diagnostics()
-    except Exception:
-        pass
+
+# robots.txt never changes at runtime, so read it once at import
+_ROBOTS_PATH = Path(__file__).parent / "static" / "robots.txt"
+_ROBOTS_BODY = (
+    _ROBOTS_PATH.read_bytes()
+    if _ROBOTS_PATH.exists()
+    else b"User-agent: *\nDisallow: /\n"  # Fallback if file doesn't exist
+)
 
 
 @app.get("/robots.txt")
 async def robots_txt():
-    robots_path = Path(__file__).parent / "static" / "robots.txt"
-    if robots_path.exists():
-        return FileResponse(robots_path, media_type="text/plain")
-    # Fallback if file doesn't exist
-    return PlainTextResponse("User-agent: *\nDisallow: /\n")
+    return PlainTextResponse(_ROBOTS_BODY)
+
+
+# Constant bodies are serialized once; the Response itself is still created
+# per request since Starlette responses carry per-call state
+_ROOT_BODY = b'{"message":"todo.house API is running!"}'
 
 
 @app.get("/")
 async def root():
-    return {"message": "todo.house API is running!"}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/api/health")
-async def health_check():
-    try:
-        # Check if env vars are loaded
-        database_url = os.getenv("DATABASE_URL")
+# Healthy results are reused for a few seconds so frequent load balancer
+# probes don't each hit the database
+HEALTH_CACHE_TTL_SECONDS = 5.0
+_health_cache: Dict[str, Any] = {"ts": 0.0, "val": None}
+_health_lock = asyncio.Lock()
+_HEALTH_QUERY = text("SELECT 1")
+
+
+def _cached_health() -> Optional[Dict[str, Any]]:
+    if (
+        _health_cache["val"]
+        and time.monotonic() - _health_cache["ts"] < HEALTH_CACHE_TTL_SECONDS
+    ):
+        return _health_cache["val"]
+    return None
+
 
-        if not database_url:
+async def _check_health() -> Dict[str, Any]:
+    try:
+        # Check if env vars are loaded (read once into config at import)
+        if not config.database.database_url:
             return {"status": "error", "message": "Missing DATABASE_URL"}
 
-        # Check SQLAlchemy database connection
-        async with get_session() as session:
-            # Simple query to test connection
-            await session.execute(text("SELECT 1"))
+        # Check the database connection straight from the pool, skipping
+        # the ORM session setup a liveness probe doesn't need
+        async with get_engine().connect() as conn:
+            await conn.scalar(_HEALTH_QUERY)
 
         return {
             "status": "healthy",
@@ -102,3 +159,32 @@ async def health_check():
         }
     except Exception as e:
         return {"status": "error", "database": f"error: {str(e)}"}
+
+
+_LIVENESS_BODY = b'{"status":"healthy"}'
+
+
+@app.get("/api/health/live")
+async def liveness_check():
+    # Liveness only: answers as soon as the process is serving requests,
+    # without touching the database
+    return Response(content=_LIVENESS_BODY, media_type="application/json")
+
+
+@app.get("/api/health")
+async def health_check():
+    cached = _cached_health()
+    if cached:
+        return cached
+
+    # Coalesce concurrent probes into a single database check
+    async with _health_lock:
+        cached = _cached_health()
+        if cached:
+            return cached
+
+        result = await _check_health()
+        if result["status"] == "healthy":
+            _health_cache["ts"] = time.monotonic()
+            _health_cache["val"] = result
+        return result
@@ -0,0 +1,68 @@
+"""ASGI middleware for the API."""
+
+import functools
+from typing import Collection, Optional, Sequence
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class AppCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that skips CORS handling for exempt paths.
+
+    Health checks, robots.txt and the root endpoint are hit by load balancers
+    and crawlers, not by the browser frontend, so they are passed straight to
+    the app without origin checks or header rewriting.
+
+    Allowed origins are kept in a frozenset for constant-time lookup, and
+    origin checks are memoized per instance: the same handful of frontend
+    origins repeat on nearly every request, so the regex match runs once per
+    distinct origin.
+    """
+
+    ORIGIN_CACHE_SIZE = 512
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        allow_origin_regex: Optional[str] = None,
+        expose_headers: Sequence[str] = (),
+        max_age: int = 600,
+        exempt_paths: Collection[str] = (),
+    ) -> None:
+        super().__init__(
+            app,
+            allow_origins=allow_origins,
+            allow_methods=allow_methods,
+            allow_headers=allow_headers,
+            allow_credentials=allow_credentials,
+            allow_origin_regex=allow_origin_regex,
+            expose_headers=expose_headers,
+            max_age=max_age,
+        )
+        self.exempt_paths = frozenset(exempt_paths)
+        self._allow_origins_set = frozenset(allow_origins)
+        self._origin_allowed = functools.lru_cache(maxsize=self.ORIGIN_CACHE_SIZE)(
+            self._check_origin
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+    def _check_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self._allow_origins_set:
+            return True
+        return bool(
+            self.allow_origin_regex and self.allow_origin_regex.fullmatch(origin)
+        )
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        return self._origin_allowed(origin)
@@ -1,10 +1,21 @@
 from datetime import datetime
-from enum import Enum
+from enum import Enum, StrEnum
 import logging
 import uuid
-from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +29,12 @@ class SnoozeOptionData(TypedDict):
 
 
 class EnhancedFieldsMixin:
-    """Mixin class for models with schedule and content fields that need JSON serialization."""
+    """Mixin class for models with schedule and content fields that need JSON serialization.
+
+    Only used on the write-side models (TaskCreate/TaskUpdate), whose values
+    are stored in JSON columns. Task is built from rows that already hold
+    plain dicts, so it doesn't need the round trip.
+    """
 
     @field_validator("schedule", "content", mode="after")
     @classmethod
@@ -31,69 +47,25 @@ class EnhancedFieldsMixin:
             return v.model_dump(mode="json")
         return v
 
-    @field_validator("schedule", "content", mode="before")
-    @classmethod
-    def convert_from_dict(cls, v, info):
-        """Convert dicts back to Pydantic models when reading from database."""
-        if v is None or not isinstance(v, dict):
-            return v
-
-        field_name = info.field_name
-
-        try:
-            if field_name == "schedule":
-                schedule_type = v.get("type")
-                if schedule_type == ScheduleType.ONCE.value:
-                    # Parse ISO format date string if present
-                    if isinstance(v.get("date"), str):
-                        v = v.copy()
-                        v["date"] = datetime.fromisoformat(
-                            v["date"].replace("Z", "+00:00")
-                        )
-                    return OnceSchedule(**v)
-                elif schedule_type == ScheduleType.RECURRING.value:
-                    # Parse ISO format date string if present
-                    if isinstance(v.get("next_occurrence"), str):
-                        v = v.copy()
-                        v["next_occurrence"] = datetime.fromisoformat(
-                            v["next_occurrence"].replace("Z", "+00:00")
-                        )
-                    return RecurringSchedule(**v)
-
-            elif field_name == "content":
-                content_type = v.get("type")
-                if content_type == ContentType.HOW_TO_GUIDE.value:
-                    return HowToContent(**v)
-                elif content_type == ContentType.CHECKLIST.value:
-                    return ChecklistContent(**v)
-                elif content_type == ContentType.SHOPPING_LIST.value:
-                    return ShoppingListContent(**v)
-        except Exception as e:
-            logger.debug(f"Could not deserialize {field_name}: {e}")
-            # Return the dict as-is if deserialization fails
-            return v
-
-        return v
-
 
-class TaskStatus(str, Enum):
+class TaskStatus(StrEnum):
     ACTIVE = "active"
     SNOOZED = "snoozed"
     COMPLETED = "completed"
 
 
-class TaskPriority(str, Enum):
+class TaskPriority(StrEnum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
 
 
-class TaskSource(str, Enum):
+class TaskSource(StrEnum):
     MANUAL = "manual"
     AI_GENERATED = "ai_generated"
 
 
-class TaskType(str, Enum):
+class TaskType(StrEnum):
     INTERIOR = "interior"
     EXTERIOR = "exterior"
     ELECTRICITY = "electricity"
@@ -103,6 +75,9 @@ class TaskType(str, Enum):
     REPAIR = "repair"
 
 
+_TASK_TYPES_BY_VALUE: Dict[str, TaskType] = {t.value: t for t in TaskType}
+
+
 # Content type models
 class ContentType(str, Enum):
     HOW_TO_GUIDE = "how_to_guide"
@@ -120,11 +95,18 @@ class HowToContent(BaseModel):
     links: Optional[List[Dict[str, str]]] = None  # [{"url": "...", "text": "..."}]
 
 
+def _new_item_id() -> str:
+    """Generate an opaque ID for a checklist item."""
+    return uuid.uuid4().hex
+
+
 class ChecklistItem(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_item_id)
     text: str
     completed: bool = False
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ChecklistContent(BaseModel):
     type: Literal[ContentType.CHECKLIST] = ContentType.CHECKLIST
@@ -136,6 +118,8 @@ class ShoppingListItem(BaseModel):
     quantity: Optional[str] = None
     purchased: bool = False
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ShoppingListContent(BaseModel):
     type: Literal[ContentType.SHOPPING_LIST] = ContentType.SHOPPING_LIST
@@ -170,7 +154,29 @@ class RecurringSchedule(BaseModel):
     next_occurrence: Optional[datetime] = None
 
 
-class TaskBase(BaseModel, EnhancedFieldsMixin):
+# Schedule/content dicts are dispatched on their "type" tag by pydantic-core.
+# Dicts that don't fit a dedicated model (e.g. notes) fall through to the
+# plain dict arm and are stored as-is.
+ScheduleField = Annotated[
+    Union[
+        Annotated[Union[OnceSchedule, RecurringSchedule], Field(discriminator="type")],
+        Dict[str, Any],
+    ],
+    Field(union_mode="left_to_right"),
+]
+ContentField = Annotated[
+    Union[
+        Annotated[
+            Union[HowToContent, ChecklistContent, ShoppingListContent],
+            Field(discriminator="type"),
+        ],
+        Dict[str, Any],
+    ],
+    Field(union_mode="left_to_right"),
+]
+
+
+class TaskBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=200)
     description: Optional[str] = Field(None, max_length=1000)
     priority: TaskPriority = TaskPriority.MEDIUM
@@ -181,16 +187,14 @@ class TaskBase(BaseModel, EnhancedFieldsMixin):
     location_id: Optional[uuid.UUID] = None
 
     # Enhanced fields
-    schedule: Optional[Union[OnceSchedule, RecurringSchedule, Dict[str, Any]]] = None
+    schedule: Optional[ScheduleField] = None
     show_after: Optional[datetime] = None
-    content: Optional[
-        Union[HowToContent, ChecklistContent, ShoppingListContent, Dict[str, Any]]
-    ] = None
+    content: Optional[ContentField] = None
     metrics: Optional[Dict[str, Any]] = None
     tags: Optional[List[str]] = None
 
 
-class TaskCreate(TaskBase):
+class TaskCreate(TaskBase, EnhancedFieldsMixin):
     source: TaskSource = TaskSource.MANUAL
     source_image_id: Optional[uuid.UUID] = None
     ai_confidence: Optional[float] = Field(None, ge=0.0, le=1.0)
@@ -208,11 +212,9 @@ class TaskUpdate(BaseModel, EnhancedFieldsMixin):
     location_id: Optional[uuid.UUID] = None
 
     # Enhanced fields
-    schedule: Optional[Union[OnceSchedule, RecurringSchedule, Dict[str, Any]]] = None
+    schedule: Optional[ScheduleField] = None
     show_after: Optional[datetime] = None
-    content: Optional[
-        Union[HowToContent, ChecklistContent, ShoppingListContent, Dict[str, Any]]
-    ] = None
+    content: Optional[ContentField] = None
     metrics: Optional[Dict[str, Any]] = None
     tags: Optional[List[str]] = None
 
@@ -236,6 +238,48 @@ class Task(TaskBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    # Columns copied straight from a database row; relationships such as
+    # `location` are left out so they are never lazy-loaded here
+    _DB_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "id",
+        "user_id",
+        "title",
+        "description",
+        "completed",
+        "snoozed_until",
+        "location_id",
+        "schedule",
+        "show_after",
+        "content",
+        "metrics",
+        "tags",
+        "source_image_id",
+        "ai_confidence",
+        "ai_provider",
+        "created_at",
+        "updated_at",
+    )
+
+    @classmethod
+    def from_db_row(cls, row: Any, **extra: Any) -> "Task":
+        """
+        Build a Task from a trusted database row without re-validating it.
+
+        Values written to the database already passed TaskCreate/TaskUpdate
+        validation, so only the columns stored as plain strings are coerced
+        back to their enums. Any extra keyword arguments (image URLs, snooze
+        options, location) are set as-is.
+        """
+        values = {
+            name: getattr(row, name) for name in cls._DB_FIELDS if hasattr(row, name)
+        }
+        values["priority"] = TaskPriority(row.priority)
+        values["status"] = TaskStatus(row.status)
+        values["source"] = TaskSource(row.source)
+        values["task_types"] = cls.parse_task_types(row.task_types)
+        values.update(extra)
+        return cls.model_construct(**values)
+
     @field_validator("task_types", mode="before")
     @classmethod
     def parse_task_types(cls, v):
@@ -245,15 +289,17 @@ class Task(TaskBase):
         if isinstance(v, list):
             parsed = []
             for item in v:
-                if isinstance(item, TaskType):
-                    parsed.append(item)
+                # TaskType is a str enum, so members and raw values share keys
+                task_type = (
+                    _TASK_TYPES_BY_VALUE.get(item) if isinstance(item, str) else None
+                )
+                if task_type is not None:
+                    parsed.append(task_type)
                 elif isinstance(item, str):
-                    try:
-                        parsed.append(TaskType(item))
-                    except ValueError:
-                        logger.warning(
-                            f"Invalid task type encountered during deserialization: {item}"
-                        )
+                    logger.warning(
+                        "Invalid task type encountered during deserialization: %s",
+                        item,
+                    )
             return parsed
         return []
 
@@ -358,6 +404,22 @@ class Location(LocationBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_db_row(cls, row: Any, is_from_defaults: bool = False) -> "Location":
+        """Build a Location from a trusted database row without re-validating it."""
+        return cls.model_construct(
+            id=row.id,
+            user_id=row.user_id,
+            name=row.name,
+            description=row.description,
+            is_active=row.is_active,
+            is_default=row.is_default,
+            location_metadata=row.location_metadata,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            is_from_defaults=is_from_defaults,
+        )
+
 
 # User settings models
 class UserSettingsUpdate(BaseModel):
@@ -383,3 +445,9 @@ class UserSettings(BaseModel):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# Built once at import; reused to serialize task responses without
+# rebuilding a serializer per request
+TASK_ADAPTER = TypeAdapter(Task)
+TASK_LIST_ADAPTER = TypeAdapter(List[Task])
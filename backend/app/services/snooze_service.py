@@ -1,5 +1,7 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta, time
-from typing import Dict, Optional, Any
+from functools import lru_cache
+from typing import Callable, ClassVar, Dict, NamedTuple, Optional, Tuple
 from enum import Enum
 from babel import Locale
 from babel.dates import format_date
@@ -12,10 +14,99 @@ class SnoozeOption(str, Enum):
     LATER = "later"  # Indefinite future
 
 
+@dataclass(slots=True, frozen=True)
+class SnoozeChoice:
+    """A computed snooze target with its human-readable label and description."""
+
+    date: datetime
+    label: str
+    description: str
+
+
+# Day offsets used by the calculators (up to 3 weeks plus a week of adjustment)
+_DAY_DELTAS = tuple(timedelta(days=days) for days in range(28))
+
+# Use a far future date (Python's datetime.max causes issues with some DBs)
+_FAR_FUTURE = datetime(2099, 12, 31, 23, 59, 59)
+_LATER_CHOICE = SnoozeChoice(
+    date=_FAR_FUTURE, label="Later", description="Indefinitely snoozed"
+)
+
+
+# (days from today, label, description) for one weekday
+SnoozeTarget = Tuple[int, str, str]
+
+
+class LocaleSnoozeInfo(NamedTuple):
+    """Week layout of a locale, resolved once and shared between calculations."""
+
+    locale: Locale
+    first_workday: int
+    last_workday: int
+    weekend_start: int
+    weekend_end: int
+    wide_day_names: Tuple[str, ...]
+    # Snooze targets indexed by the current weekday (0 = Monday)
+    context_table: Tuple[SnoozeTarget, ...] = ()
+    next_week_table: Tuple[SnoozeTarget, ...] = ()
+
+    def is_weekend(self, weekday: int) -> bool:
+        return self.weekend_start <= weekday <= self.weekend_end
+
+    def day_name(self, weekday: int, fallback: str) -> str:
+        """Localized weekday name, or ``fallback`` when the locale lacks the data."""
+        if len(self.wide_day_names) == 7:
+            return self.wide_day_names[weekday]
+        return fallback
+
+
+# Computes one option's SnoozeChoice from (now, current_weekday, info)
+SnoozeCalculator = Callable[[datetime, int, LocaleSnoozeInfo], SnoozeChoice]
+
+
+@lru_cache(maxsize=128)
+def _locale_info(locale_id: str) -> LocaleSnoozeInfo:
+    """Parse a locale and resolve its workdays, weekend and day names once."""
+    locale = Locale.parse(locale_id)
+    try:
+        wide = locale.days["format"]["wide"]
+        day_names: Tuple[str, ...] = tuple(wide[day] for day in range(7))
+    except (KeyError, TypeError):
+        day_names = ()
+    info = LocaleSnoozeInfo(
+        locale=locale,
+        first_workday=SnoozeService.get_first_workday(locale),
+        last_workday=SnoozeService.get_last_workday(locale),
+        weekend_start=locale.weekend_start,
+        weekend_end=locale.weekend_end,
+        wide_day_names=day_names,
+    )
+    return info._replace(
+        context_table=tuple(
+            SnoozeService._context_sensitive_target(day, info) for day in range(7)
+        ),
+        next_week_table=tuple(
+            SnoozeService._next_week_target(day, info) for day in range(7)
+        ),
+    )
+
+
+def _resolve_locale_info(locale_str: str) -> LocaleSnoozeInfo:
+    """Resolve locale info from an Accept-Language style string (e.g. "en-us,en;q=0.9")."""
+    # Take the first locale before any quality values
+    locale_parts = locale_str.split(",")[0].split(";")[0].strip()
+    # Babel wants underscores and ignores case, so fold hyphen and case
+    # variants (en-us, en_US, EN-us) into one cache key
+    locale_parts = locale_parts.replace("-", "_").lower()
+    # Resolve the locale's week layout (cached per identifier)
+    return _locale_info(locale_parts)
+
+
 class SnoozeService:
     """Service for calculating intelligent snooze options based on context and locale."""
 
     DEFAULT_TASK_TIME = time(9, 0)  # 9 AM for snoozed tasks
+    DEFAULT_TASK_TIME_STR = DEFAULT_TASK_TIME.strftime("%I:%M %p")
 
     @classmethod
     def is_weekend(cls, weekday: int, locale: Locale) -> bool:
@@ -44,230 +135,191 @@ class SnoozeService:
         # Work backwards from weekend_start to find last workday
         return (locale.weekend_start - 1) % 7
 
+    # Calculator per option; filled in below the class body
+    _CALCULATORS: ClassVar[Dict[SnoozeOption, SnoozeCalculator]]
+
+    @classmethod
+    def _at_default_time(cls, now: datetime, days: int) -> datetime:
+        """Return ``now`` moved forward by ``days`` at the default task time."""
+        # Snooze targets are naive local times, matching datetime.combine
+        return (now + _DAY_DELTAS[days]).replace(
+            hour=cls.DEFAULT_TASK_TIME.hour,
+            minute=cls.DEFAULT_TASK_TIME.minute,
+            second=0,
+            microsecond=0,
+            tzinfo=None,
+        )
+
     @classmethod
     def calculate_snooze_options(
         cls, current_datetime: Optional[datetime] = None, locale_str: str = "en_US"
-    ) -> Dict[SnoozeOption, Dict[str, Any]]:
+    ) -> Dict[SnoozeOption, SnoozeChoice]:
         """
         Calculate all snooze options based on the current date/time context and locale.
 
-        Returns a dictionary with snooze options as keys and dictionaries containing:
+        Returns a dictionary with snooze options as keys and SnoozeChoice values with:
         - date: The target datetime for the snooze
         - label: Human-readable label for the option
         - description: Additional context about when the task will resurface
         """
         now = current_datetime or datetime.now()
         current_weekday = now.weekday()  # 0 = Monday, 6 = Sunday
+        info = _resolve_locale_info(locale_str)
 
-        # Parse locale from Accept-Language header format (e.g., "en-us,en;q=0.9")
-        # Take the first locale before any quality values
-        locale_parts = locale_str.split(",")[0].split(";")[0].strip()
-        # Replace hyphen with underscore for Babel compatibility
-        locale_parts = locale_parts.replace("-", "_")
-
-        # Get locale from Babel
-        babel_locale = Locale.parse(locale_parts)
-
-        options = {}
+        return {
+            option: calculator(now, current_weekday, info)
+            for option, calculator in cls._CALCULATORS.items()
+        }
 
-        # Option 1: Context-sensitive (weekend/tomorrow)
-        context_option = cls._calculate_context_sensitive_snooze(
-            now, current_weekday, babel_locale
+    @classmethod
+    def _calculate_context_sensitive_snooze(
+        cls, now: datetime, current_weekday: int, info: LocaleSnoozeInfo
+    ) -> SnoozeChoice:
+        """Calculate context-sensitive snooze from the locale's precomputed table."""
+        days, label, description = info.context_table[current_weekday]
+        return SnoozeChoice(
+            date=cls._at_default_time(now, days),
+            label=label,
+            description=description,
         )
-        options[SnoozeOption.CONTEXT_SENSITIVE] = context_option
 
-        # Option 2: Next week
-        next_week_option = cls._calculate_next_week_snooze(
-            now, current_weekday, babel_locale
+    @classmethod
+    def _calculate_next_week_snooze(
+        cls, now: datetime, current_weekday: int, info: LocaleSnoozeInfo
+    ) -> SnoozeChoice:
+        """Calculate next-week snooze from the locale's precomputed table."""
+        days, label, description = info.next_week_table[current_weekday]
+        return SnoozeChoice(
+            date=cls._at_default_time(now, days),
+            label=label,
+            description=description,
         )
-        options[SnoozeOption.NEXT_WEEK] = next_week_option
-
-        # Option 3: Few weeks (~3 weeks)
-        few_weeks_option = cls._calculate_few_weeks_snooze(now, babel_locale)
-        options[SnoozeOption.FEW_WEEKS] = few_weeks_option
-
-        # Option 4: Later (indefinite)
-        later_option = cls._calculate_later_snooze(babel_locale)
-        options[SnoozeOption.LATER] = later_option
-
-        return options
 
     @classmethod
-    def _calculate_context_sensitive_snooze(
-        cls, now: datetime, current_weekday: int, locale: Locale
-    ) -> Dict[str, Any]:
+    def _context_sensitive_target(
+        cls, current_weekday: int, info: LocaleSnoozeInfo
+    ) -> SnoozeTarget:
         """
-        Calculate context-sensitive snooze based on current day and locale.
+        Work out the context-sensitive snooze for a weekday and locale.
 
         Logic:
         - Midweek (not last workday): Snooze to weekend
         - Last workday: Snooze to tomorrow
         - Weekend: Snooze to next work week's first day
         """
-        is_workday = cls.is_workday(current_weekday, locale)
-        last_workday = cls.get_last_workday(locale)
-        is_last_workday = current_weekday == last_workday
+        is_workday = not info.is_weekend(current_weekday)
+        is_last_workday = current_weekday == info.last_workday
 
         if is_workday and not is_last_workday:
             # Midweek: snooze to weekend start
-            days_until_weekend = (locale.weekend_start - current_weekday) % 7
+            days_until_weekend = (info.weekend_start - current_weekday) % 7
             if days_until_weekend == 0:
                 days_until_weekend = 7
 
-            target_date = now + timedelta(days=days_until_weekend)
-            target_datetime = datetime.combine(
-                target_date.date(), cls.DEFAULT_TASK_TIME
-            )
+            day_name = info.day_name(info.weekend_start, "Weekend")
 
-            # Get localized day name
-            try:
-                day_name = locale.days["format"]["wide"][locale.weekend_start]
-            except (KeyError, TypeError):
-                day_name = "Weekend"
-
-            return {
-                "date": target_datetime,
-                "label": "This weekend",
-                "description": f"{day_name} at {cls.DEFAULT_TASK_TIME.strftime('%I:%M %p')}",
-            }
+            return (
+                days_until_weekend,
+                "This weekend",
+                f"{day_name} at {cls.DEFAULT_TASK_TIME_STR}",
+            )
 
         elif is_last_workday:
             # Last workday: snooze to tomorrow
-            target_date = now + timedelta(days=1)
-            target_datetime = datetime.combine(
-                target_date.date(), cls.DEFAULT_TASK_TIME
-            )
-
-            return {
-                "date": target_datetime,
-                "label": "Tomorrow",
-                "description": f"Tomorrow at {cls.DEFAULT_TASK_TIME.strftime('%I:%M %p')}",
-            }
+            return 1, "Tomorrow", f"Tomorrow at {cls.DEFAULT_TASK_TIME_STR}"
 
         else:
             # Weekend: snooze to first workday
-            first_workday = cls.get_first_workday(locale)
+            first_workday = info.first_workday
             days_until_workday = (first_workday - current_weekday) % 7
             if days_until_workday == 0:
                 days_until_workday = 7
 
-            target_date = now + timedelta(days=days_until_workday)
-            target_datetime = datetime.combine(
-                target_date.date(), cls.DEFAULT_TASK_TIME
-            )
-
-            # Get localized day name
-            try:
-                day_name = locale.days["format"]["wide"][first_workday]
-            except (KeyError, TypeError):
-                day_name = "Weekday"
+            day_name = info.day_name(first_workday, "Weekday")
 
-            return {
-                "date": target_datetime,
-                "label": "Next week",
-                "description": f"{day_name} at {cls.DEFAULT_TASK_TIME.strftime('%I:%M %p')}",
-            }
+            return (
+                days_until_workday,
+                "Next week",
+                f"{day_name} at {cls.DEFAULT_TASK_TIME_STR}",
+            )
 
     @classmethod
-    def _calculate_next_week_snooze(
-        cls, now: datetime, current_weekday: int, locale: Locale
-    ) -> Dict[str, Any]:
+    def _next_week_target(
+        cls, current_weekday: int, info: LocaleSnoozeInfo
+    ) -> SnoozeTarget:
         """
-        Calculate snooze to next week based on current day and locale.
+        Work out the next-week snooze for a weekday and locale.
 
         Logic:
         - Weekday: Snooze to next week's first workday
         - Weekend: Snooze to next weekend
         """
-        is_workday = cls.is_workday(current_weekday, locale)
+        is_workday = not info.is_weekend(current_weekday)
 
         if is_workday:
             # Weekday: snooze to next week's first workday
-            first_workday = cls.get_first_workday(locale)
+            first_workday = info.first_workday
             # Calculate days until the first workday of next week
             days_until_workday = (first_workday - current_weekday) % 7
             # If we're already past or at the first workday, add 7 days
             if days_until_workday <= 0:
                 days_until_workday += 7
 
-            target_date = now + timedelta(days=days_until_workday)
-            target_datetime = datetime.combine(
-                target_date.date(), cls.DEFAULT_TASK_TIME
-            )
+            day_name = info.day_name(first_workday, "Weekday")
 
-            # Get localized day name
-            try:
-                day_name = locale.days["format"]["wide"][first_workday]
-            except (KeyError, TypeError):
-                day_name = "Weekday"
-
-            return {
-                "date": target_datetime,
-                "label": "Next week",
-                "description": f"Next {day_name} at {cls.DEFAULT_TASK_TIME.strftime('%I:%M %p')}",
-            }
+            return (
+                days_until_workday,
+                "Next week",
+                f"Next {day_name} at {cls.DEFAULT_TASK_TIME_STR}",
+            )
         else:
             # Weekend: snooze to next weekend
-            days_until_next_weekend = ((locale.weekend_start - current_weekday) % 7) + 7
+            days_until_next_weekend = ((info.weekend_start - current_weekday) % 7) + 7
 
-            target_date = now + timedelta(days=days_until_next_weekend)
-            target_datetime = datetime.combine(
-                target_date.date(), cls.DEFAULT_TASK_TIME
-            )
+            day_name = info.day_name(info.weekend_start, "Weekend")
 
-            # Get localized day name
-            try:
-                day_name = locale.days["format"]["wide"][locale.weekend_start]
-            except (KeyError, TypeError):
-                day_name = "Weekend"
-
-            return {
-                "date": target_datetime,
-                "label": "Next weekend",
-                "description": f"Next {day_name} at {cls.DEFAULT_TASK_TIME.strftime('%I:%M %p')}",
-            }
+            return (
+                days_until_next_weekend,
+                "Next weekend",
+                f"Next {day_name} at {cls.DEFAULT_TASK_TIME_STR}",
+            )
 
     @classmethod
     def _calculate_few_weeks_snooze(
-        cls, now: datetime, locale: Locale
-    ) -> Dict[str, Any]:
+        cls, now: datetime, current_weekday: int, info: LocaleSnoozeInfo
+    ) -> SnoozeChoice:
         """Calculate snooze for approximately 3 weeks from now."""
         # Go to the first workday approximately 3 weeks from now
-        first_workday = cls.get_first_workday(locale)
+        first_workday = info.first_workday
 
-        # Add 3 weeks
-        target_date = now + timedelta(weeks=3)
+        # 3 weeks from now falls on the same weekday as today
+        target_weekday = current_weekday
 
         # Adjust to the next occurrence of first_workday
-        target_weekday = target_date.weekday()
         days_until_workday = (first_workday - target_weekday) % 7
-        if days_until_workday == 0 and cls.is_weekend(target_weekday, locale):
+        if days_until_workday == 0 and info.is_weekend(target_weekday):
             # If 3 weeks lands on weekend, go to next first workday
             days_until_workday = 7
 
-        target_date = target_date + timedelta(days=days_until_workday)
-        target_datetime = datetime.combine(target_date.date(), cls.DEFAULT_TASK_TIME)
+        target_datetime = cls._at_default_time(now, 21 + days_until_workday)
 
         # Format date using Babel
-        formatted_date = format_date(target_date.date(), format="long", locale=locale)
+        formatted_date = format_date(
+            target_datetime.date(), format="long", locale=info.locale
+        )
 
-        return {
-            "date": target_datetime,
-            "label": "In a few weeks",
-            "description": f"3 weeks from now ({formatted_date})",
-        }
+        return SnoozeChoice(
+            date=target_datetime,
+            label="In a few weeks",
+            description=f"3 weeks from now ({formatted_date})",
+        )
 
     @classmethod
-    def _calculate_later_snooze(cls, babel_locale: Locale) -> Dict[str, Any]:
+    def _calculate_later_snooze(
+        cls, now: datetime, current_weekday: int, info: LocaleSnoozeInfo
+    ) -> SnoozeChoice:
         """Calculate indefinite 'Later' snooze."""
-        # Use a far future date (Python's datetime.max causes issues with some DBs)
-        far_future = datetime(2099, 12, 31, 23, 59, 59)
-
-        return {
-            "date": far_future,
-            "label": "Later",
-            "description": "Indefinitely snoozed",
-        }
+        return _LATER_CHOICE
 
     @classmethod
     def get_snooze_date_by_option(
@@ -276,8 +328,18 @@ class SnoozeService:
         current_datetime: Optional[datetime] = None,
         locale_str: str = "en_US",
     ) -> datetime:
-        """Get the snooze date for a specific option."""
-        options = cls.calculate_snooze_options(current_datetime, locale_str)
-        if option not in options:
+        """Get the snooze date for a specific option, computing only that option."""
+        calculator = cls._CALCULATORS.get(option)
+        if calculator is None:
             raise ValueError(f"Invalid snooze option: {option}")
-        return options[option]["date"]
+        now = current_datetime or datetime.now()
+        info = _resolve_locale_info(locale_str)
+        return calculator(now, now.weekday(), info).date
+
+
+SnoozeService._CALCULATORS = {
+    SnoozeOption.CONTEXT_SENSITIVE: SnoozeService._calculate_context_sensitive_snooze,
+    SnoozeOption.NEXT_WEEK: SnoozeService._calculate_next_week_snooze,
+    SnoozeOption.FEW_WEEKS: SnoozeService._calculate_few_weeks_snooze,
+    SnoozeOption.LATER: SnoozeService._calculate_later_snooze,
+}
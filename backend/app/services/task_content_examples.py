@@ -1,6 +1,7 @@
 """Example usage of the flexible task content and metrics system."""
 
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 from ..models import (
@@ -21,13 +22,10 @@ from ..models import (
 )
 
 
-def create_washing_machine_task() -> TaskCreate:
-    """Example: Create a recurring maintenance task with how-to guide."""
-
-    # Create how-to content
-    content = HowToContent(
-        type=ContentType.HOW_TO_GUIDE,
-        markdown="""## How to Clean Your Washing Machine
+# How-to guide shared by every washing machine example task
+_WASHING_MACHINE_GUIDE = HowToContent(
+    type=ContentType.HOW_TO_GUIDE,
+    markdown="""## How to Clean Your Washing Machine
 
 ### Why Clean Your Washing Machine?
 Over time, soap residue, fabric softener, and lint can build up inside your washing machine, 
@@ -63,29 +61,33 @@ leading to bad odors and reduced efficiency.
    - After cleaning, leave the door open for a few hours
    - This prevents mold and mildew growth
 """,
-        images=[
-            {
-                "url": "https://example.com/washing-machine-seal.jpg",
-                "caption": "Pay special attention to the rubber seal",
-            },
-            {
-                "url": "https://example.com/vinegar-dispenser.jpg",
-                "caption": "Pour vinegar into the detergent dispenser",
-            },
-        ],
-        videos=[
-            {
-                "url": "https://youtube.com/watch?v=example",
-                "title": "Complete Washing Machine Cleaning Tutorial",
-            }
-        ],
-        links=[
-            {
-                "url": "https://samsung.com/support/washing-machine-maintenance",
-                "text": "Manufacturer's Maintenance Guide",
-            }
-        ],
-    )
+    images=[
+        {
+            "url": "https://example.com/washing-machine-seal.jpg",
+            "caption": "Pay special attention to the rubber seal",
+        },
+        {
+            "url": "https://example.com/vinegar-dispenser.jpg",
+            "caption": "Pour vinegar into the detergent dispenser",
+        },
+    ],
+    videos=[
+        {
+            "url": "https://youtube.com/watch?v=example",
+            "title": "Complete Washing Machine Cleaning Tutorial",
+        }
+    ],
+    links=[
+        {
+            "url": "https://samsung.com/support/washing-machine-maintenance",
+            "text": "Manufacturer's Maintenance Guide",
+        }
+    ],
+)
+
+
+def create_washing_machine_task() -> TaskCreate:
+    """Example: Create a recurring maintenance task with how-to guide."""
 
     # Create metrics
     metrics = {
@@ -110,7 +112,7 @@ leading to bad odors and reduced efficiency.
         description="Quarterly maintenance to keep your washing machine fresh and efficient",
         priority=TaskPriority.MEDIUM,
         task_types=[TaskType.APPLIANCES, TaskType.MAINTENANCE],
-        content=content,  # Will be converted to dict by validator
+        content=_WASHING_MACHINE_GUIDE,  # Will be converted to dict by validator
         metrics=metrics,
         schedule=schedule,  # Will be converted to dict by validator
         tags=["maintenance", "appliances", "cleaning", "quarterly"],
@@ -119,23 +121,21 @@ leading to bad odors and reduced efficiency.
     )
 
 
+# Renovation sub-task texts; items are built per task so each gets fresh IDs
+_BATHROOM_CHECKLIST_ITEMS = (
+    "Research and hire contractor",
+    "Choose tile and fixtures",
+    "Get permits from city",
+    "Order materials",
+    "Prepare bathroom (remove items)",
+    "Demo day preparation",
+    "Final walkthrough with contractor",
+)
+
+
 def create_bathroom_renovation_task() -> TaskCreate:
     """Example: Create a task with sub-tasks checklist."""
 
-    # Create checklist content
-    content = ChecklistContent(
-        type=ContentType.CHECKLIST,
-        items=[
-            ChecklistItem(text="Research and hire contractor", completed=False),
-            ChecklistItem(text="Choose tile and fixtures", completed=False),
-            ChecklistItem(text="Get permits from city", completed=False),
-            ChecklistItem(text="Order materials", completed=False),
-            ChecklistItem(text="Prepare bathroom (remove items)", completed=False),
-            ChecklistItem(text="Demo day preparation", completed=False),
-            ChecklistItem(text="Final walkthrough with contractor", completed=False),
-        ],
-    )
-
     # Complex project metrics
     metrics = {
         "complexity": "high",
@@ -146,12 +146,21 @@ def create_bathroom_renovation_task() -> TaskCreate:
         "disruption_level": "high",
     }
 
+    # Renovation sub-tasks checklist
+    checklist = ChecklistContent(
+        type=ContentType.CHECKLIST,
+        items=[
+            ChecklistItem(text=text, completed=False)
+            for text in _BATHROOM_CHECKLIST_ITEMS
+        ],
+    )
+
     return TaskCreate(
         title="Bathroom Renovation",
         description="Complete renovation of the master bathroom",
         priority=TaskPriority.HIGH,
         task_types=[TaskType.INTERIOR, TaskType.PLUMBING, TaskType.ELECTRICITY],
-        content=content,  # Will be converted to dict by validator
+        content=checklist,  # Will be converted to dict by validator
         metrics=metrics,
         tags=["renovation", "bathroom", "major-project"],
         source=TaskSource.MANUAL,
@@ -159,32 +168,33 @@ def create_bathroom_renovation_task() -> TaskCreate:
     )
 
 
+# Painting supplies shopping list
+_PAINTING_SHOPPING_LIST = ShoppingListContent(
+    type=ContentType.SHOPPING_LIST,
+    items=[
+        ShoppingListItem(
+            name="Paint - Eggshell White", quantity="2 gallons", purchased=False
+        ),
+        ShoppingListItem(
+            name="Paint brushes", quantity="3 (various sizes)", purchased=False
+        ),
+        ShoppingListItem(name="Painter's tape", quantity="2 rolls", purchased=True),
+        ShoppingListItem(name="Drop cloths", quantity="2 large", purchased=False),
+        ShoppingListItem(
+            name="Paint roller and tray", quantity="1 set", purchased=False
+        ),
+        ShoppingListItem(
+            name="Sandpaper", quantity="Mixed grits pack", purchased=False
+        ),
+    ],
+    store="Home Depot",
+    estimated_cost=125.50,
+)
+
+
 def create_shopping_list_task() -> TaskCreate:
     """Example: Create a shopping list task."""
 
-    # Create shopping list content
-    content = ShoppingListContent(
-        type=ContentType.SHOPPING_LIST,
-        items=[
-            ShoppingListItem(
-                name="Paint - Eggshell White", quantity="2 gallons", purchased=False
-            ),
-            ShoppingListItem(
-                name="Paint brushes", quantity="3 (various sizes)", purchased=False
-            ),
-            ShoppingListItem(name="Painter's tape", quantity="2 rolls", purchased=True),
-            ShoppingListItem(name="Drop cloths", quantity="2 large", purchased=False),
-            ShoppingListItem(
-                name="Paint roller and tray", quantity="1 set", purchased=False
-            ),
-            ShoppingListItem(
-                name="Sandpaper", quantity="Mixed grits pack", purchased=False
-            ),
-        ],
-        store="Home Depot",
-        estimated_cost=125.50,
-    )
-
     # Simple metrics for shopping
     metrics = {
         "urgency": "this_week",
@@ -198,7 +208,7 @@ def create_shopping_list_task() -> TaskCreate:
         description="Get all supplies needed for weekend painting project",
         priority=TaskPriority.HIGH,
         task_types=[TaskType.INTERIOR],
-        content=content,  # Will be converted to dict by validator
+        content=_PAINTING_SHOPPING_LIST,  # Will be converted to dict by validator
         metrics=metrics,
         tags=["shopping", "painting", "living-room"],
         source=TaskSource.MANUAL,
@@ -210,12 +220,9 @@ def create_future_task() -> TaskCreate:
     """Example: Create a task that won't be visible until a future date."""
 
     # Calculate next spring (approximately)
-    now = datetime.now(timezone.utc)
-    next_spring = (
-        datetime(now.year + 1, 3, 20, tzinfo=timezone.utc)
-        if now.month > 3
-        else datetime(now.year, 3, 20, tzinfo=timezone.utc)
-    )
+    utc = timezone.utc
+    now = datetime.now(utc)
+    next_spring = datetime(now.year + (1 if now.month > 3 else 0), 3, 20, tzinfo=utc)
 
     return TaskCreate(
         title="Spring Garden Preparation",
@@ -246,26 +253,30 @@ def parse_task_content(content: Dict[str, Any]) -> str:
     if not content:
         return ""
 
-    content_type = content.get("type")
+    # str enums compare equal to their raw values, so they match stored dicts
+    match content.get("type"):
+        case ContentType.HOW_TO_GUIDE:
+            return (
+                f"How-to guide with {len(content.get('images') or ())} images, "
+                f"{len(content.get('videos') or ())} videos"
+            )
+        case ContentType.CHECKLIST:
+            items = content.get("items") or ()
+            completed = sum(1 for item in items if item.get("completed", False))
+            return f"Checklist: {completed}/{len(items)} completed"
+        case ContentType.SHOPPING_LIST:
+            items = content.get("items") or ()
+            purchased = sum(1 for item in items if item.get("purchased", False))
+            store = content.get("store", "Unknown")
+            return f"Shopping list for {store}: {purchased}/{len(items)} purchased"
 
-    if content_type == ContentType.HOW_TO_GUIDE.value:
-        return (
-            f"How-to guide with {len(content.get('images', []))} images, "
-            f"{len(content.get('videos', []))} videos"
-        )
-
-    elif content_type == ContentType.CHECKLIST.value:
-        items = content.get("items", [])
-        completed = sum(1 for item in items if item.get("completed", False))
-        return f"Checklist: {completed}/{len(items)} completed"
+    return "Custom content"
 
-    elif content_type == ContentType.SHOPPING_LIST.value:
-        items = content.get("items", [])
-        purchased = sum(1 for item in items if item.get("purchased", False))
-        store = content.get("store", "Unknown")
-        return f"Shopping list for {store}: {purchased}/{len(items)} purchased"
 
-    return "Custom content"
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp; many tasks share the same schedule strings."""
+    return datetime.fromisoformat(value)
 
 
 def get_next_scheduled_date(schedule: Dict[str, Any]) -> Optional[datetime]:
@@ -275,16 +286,14 @@ def get_next_scheduled_date(schedule: Dict[str, Any]) -> Optional[datetime]:
     if not schedule:
         return None
 
-    schedule_type = schedule.get("type")
-
-    if schedule_type == ScheduleType.ONCE.value:
-        date_str = schedule.get("date")
-        if date_str:
-            return datetime.fromisoformat(date_str)
-
-    elif schedule_type == ScheduleType.RECURRING.value:
-        occurrence_str = schedule.get("next_occurrence")
-        if occurrence_str:
-            return datetime.fromisoformat(occurrence_str)
+    match schedule.get("type"):
+        case ScheduleType.ONCE:
+            date_str = schedule.get("date")
+        case ScheduleType.RECURRING:
+            date_str = schedule.get("next_occurrence")
+        case _:
+            date_str = None
 
+    if date_str:
+        return _parse_iso(date_str)
     return None
@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from typing import List, Optional
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -5,6 +6,11 @@ from ..models import TaskPriority, AITaskCreate
 from ..database import Task as TaskModel
 
 
+# Confidence cutoffs and the priority for each band between them
+_CONFIDENCE_CUTOFFS = (0.6, 0.8)
+_PRIORITY_BY_BAND = (TaskPriority.LOW, TaskPriority.MEDIUM, TaskPriority.HIGH)
+
+
 class TaskService:
     """Service for handling task creation and management logic"""
 
@@ -18,12 +24,7 @@ class TaskService:
         - >= 0.6: Medium priority (moderately confident)
         - < 0.6: Low priority (less certain, needs verification)
         """
-        if confidence >= 0.8:
-            return TaskPriority.HIGH
-        elif confidence >= 0.6:
-            return TaskPriority.MEDIUM
-        else:
-            return TaskPriority.LOW
+        return _PRIORITY_BY_BAND[bisect_right(_CONFIDENCE_CUTOFFS, confidence)]
 
     @staticmethod
     async def create_ai_tasks(
@@ -40,20 +41,18 @@ class TaskService:
         Returns:
             List of created task ORM instances
         """
-        created_tasks = []
+        created_tasks: List[TaskModel] = []
+        default_priority = TaskPriority.MEDIUM
+        priority_from_confidence = TaskService.determine_priority_from_confidence
 
         for task in tasks:
-            # Convert task_types enum list to string list for JSONB storage
-            task_types_str = []
-            if task.task_types:
-                task_types_str = [tt.value for tt in task.task_types]
+            # TaskType members are strings, so the list is stored as-is
+            task_types_str = list(task.task_types or ())
 
             # Override priority based on AI confidence if not already set
             priority = task.priority
-            if task.priority == TaskPriority.MEDIUM:  # Default value
-                priority = TaskService.determine_priority_from_confidence(
-                    task.ai_confidence
-                )
+            if priority == default_priority:
+                priority = priority_from_confidence(task.ai_confidence)
 
             # Create SQLAlchemy model instance
             db_task = TaskModel(
@@ -71,16 +70,13 @@ class TaskService:
                 task_types=task_types_str,
             )
 
-            session.add(db_task)
             created_tasks.append(db_task)
 
-        # Commit all tasks at once
+        # Insert all tasks in one flush so IDs are assigned before commit
+        session.add_all(created_tasks)
+        await session.flush()
         await session.commit()
 
-        # Refresh to get IDs and timestamps
-        for db_task in created_tasks:
-            await session.refresh(db_task)
-
         return created_tasks
 
     @staticmethod
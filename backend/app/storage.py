@@ -1,7 +1,9 @@
 """Storage abstraction layer for file uploads."""
 
+import asyncio
 import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Any
 from supabase import create_client, Client
 from dotenv import load_dotenv
@@ -48,12 +50,19 @@ class SupabaseStorageProvider(StorageProvider):
             )
 
         self.client: Client = create_client(supabase_url, supabase_key)
+        # Bucket handles are stateless wrappers; build ours once
+        self._bucket = self.client.storage.from_(bucket_name)
+        # Public URLs don't expire and depend only on the path, so each one is
+        # built once per provider
+        self._public_url = lru_cache(maxsize=4096)(self._bucket.get_public_url)
 
     async def upload(
         self, file_data: bytes, path: str, content_type: str
     ) -> Dict[str, Any]:
         """Upload a file to Supabase storage."""
-        response = self.client.storage.from_(self.bucket_name).upload(
+        # The Supabase client is synchronous; run it off the event loop
+        response = await asyncio.to_thread(
+            self._bucket.upload,
             file=file_data,
             path=path,
             file_options={"content-type": content_type, "upsert": "true"},
@@ -62,12 +71,12 @@ class SupabaseStorageProvider(StorageProvider):
 
     def get_public_url(self, path: str) -> str:
         """Get public URL for a file in Supabase storage."""
-        return self.client.storage.from_(self.bucket_name).get_public_url(path)
+        return self._public_url(path)
 
     async def download_file(self, path: str) -> bytes:
         """Download a file from Supabase storage."""
-        response = self.client.storage.from_(self.bucket_name).download(path)
-        return response
+        # The Supabase client is synchronous; run it off the event loop
+        return await asyncio.to_thread(self._bucket.download, path)
 
 
 # Factory function to get storage provider
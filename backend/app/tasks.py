@@ -1,11 +1,25 @@
-from fastapi import APIRouter, HTTPException, Header, Query, Depends
-from typing import List, Optional, Sequence, Dict
+from fastapi import APIRouter, HTTPException, Header, Query, Depends, Response
+from typing import (
+    Annotated,
+    Any,
+    Collection,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Dict,
+    Tuple,
+)
+import hashlib
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import Select, bindparam, delete, select, and_, update
 from sqlalchemy.exc import SQLAlchemyError
+from pydantic import Field
 from .models import (
     Task,
+    TASK_ADAPTER,
+    TASK_LIST_ADAPTER,
     TaskCreate,
     TaskUpdate,
     TaskStatus,
@@ -13,6 +27,7 @@ from .models import (
     AITaskCreate,
     TaskSource,
     Location,
+    SnoozeOptionData,
 )
 from .database import (
     get_session_dependency,
@@ -30,6 +45,11 @@ from .auth import get_current_user
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 logger = StructuredLogger(__name__)
 
+# Single-task lookup scoped to its owner, built once and bound per request
+_OWNED_TASK_STMT = select(TaskModel).where(
+    TaskModel.id == bindparam("task_id"), TaskModel.user_id == bindparam("uid")
+)
+
 
 async def get_locale_data_dependency(
     current_user: UserModel = Depends(get_current_user),
@@ -53,21 +73,26 @@ async def get_locale_data_dependency(
 
 
 async def populate_task_related_data(
-    tasks: Sequence[TaskModel], session: AsyncSession, locale_str: str = "en_US"
+    tasks: Sequence[TaskModel],
+    session: AsyncSession,
+    locale_str: str = "en_US",
+    image_ids: Optional[Set[uuid.UUID]] = None,
 ) -> List[Task]:
     """
     Populate image URLs, snooze options, and location data for tasks.
 
     This function:
-    1. Fetches all unique images and locations in single database queries for performance
-    2. Caches storage URLs to avoid duplicate API calls
-    3. Calculates snooze options based on locale
-    4. Handles database and storage errors gracefully
+    1. Fetches all unique images (unless the caller joined them) and locations
+       in single database queries for performance
+    2. Calculates snooze options based on locale
+    3. Handles database errors gracefully
 
     Args:
         tasks: List of task models from database
         session: Database session
         locale_str: Locale string for calculating snooze options
+        image_ids: IDs of the tasks' source images already known to exist
+            (e.g. from a join); when given, the images aren't queried again
 
     Returns:
         List of Task models with populated image URLs, snooze options, and location data.
@@ -75,40 +100,41 @@ async def populate_task_related_data(
 
     Error Handling:
         - Database query failures: Logs error and returns tasks without extra data
-        - Storage URL generation failures: Logs warning and skips URL for that task
-        - Individual task failures don't affect other tasks
     """
-    # Get all unique image IDs
-    image_ids = [task.source_image_id for task in tasks if task.source_image_id]
-
     # Get all unique location IDs
     location_ids = [task.location_id for task in tasks if task.location_id]
 
-    # Fetch all images in one query with error handling
-    images: Dict[uuid.UUID, ImageModel] = {}
-    if image_ids:
+    # Fetch all images in one query with error handling, unless the caller
+    # already joined them in
+    existing_image_ids: Collection[uuid.UUID] = image_ids or ()
+    wanted_image_ids = [task.source_image_id for task in tasks if task.source_image_id]
+    if image_ids is None and wanted_image_ids:
         try:
-            query = select(ImageModel).where(ImageModel.id.in_(image_ids))
+            query = select(ImageModel).where(ImageModel.id.in_(wanted_image_ids))
             result = await session.execute(query)
-            images = {img.id: img for img in result.scalars()}
+            existing_image_ids = {img.id for img in result.scalars()}
         except SQLAlchemyError as e:
             logger.error(
                 "Failed to fetch images from database",
                 error_type=type(e).__name__,
                 error_message=str(e),
-                image_count=len(image_ids),
+                image_count=len(wanted_image_ids),
                 task_count=len(tasks),
             )
 
     # Fetch all locations in one query with error handling
-    locations: Dict[uuid.UUID, LocationModel] = {}
+    locations: Dict[uuid.UUID, Location] = {}
     if location_ids:
         try:
             location_query = select(LocationModel).where(
                 LocationModel.id.in_(location_ids)
             )
             location_result = await session.execute(location_query)
-            locations = {loc.id: loc for loc in location_result.scalars().all()}
+            # Build each response model once, however many tasks share it
+            locations = {
+                loc.id: Location.from_db_row(loc)
+                for loc in location_result.scalars().all()
+            }
         except SQLAlchemyError as e:
             logger.error(
                 "Failed to fetch locations from database",
@@ -122,54 +148,96 @@ async def populate_task_related_data(
 
     # Calculate snooze options once for all tasks
     snooze_options = SnoozeService.calculate_snooze_options(locale_str=locale_str)
-    # Convert datetime objects to ISO strings for JSON serialization
-    serializable_snooze_options = {}
-    for option, data in snooze_options.items():
-        serializable_snooze_options[option.value] = {
-            "date": data["date"].isoformat(),
-            "label": data["label"],
-            "description": data["description"],
+    # Key by option value; datetimes are serialized with the response
+    task_snooze_options: Dict[str, SnoozeOptionData] = {
+        option.value: {
+            "date": choice.date,
+            "label": choice.label,
+            "description": choice.description,
         }
+        for option, choice in snooze_options.items()
+    }
 
     # Convert tasks and populate image URLs, location data, and snooze options
     task_models = []
     for task in tasks:
-        task_dict = Task.model_validate(task).model_dump()
-
-        # Populate image URLs if available
-        if task.source_image_id and task.source_image_id in images:
-            image = images[task.source_image_id]
-
-            # Use proxy endpoint instead of direct Supabase URL
-            try:
-                proxy_url = f"/api/images/proxy/{image.id}"
-                task_dict["image_url"] = proxy_url
-                task_dict["thumbnail_url"] = proxy_url
-
-            except Exception as e:
-                # Log error but don't fail the entire operation
-                logger.warning(
-                    "Failed to generate storage URL for image",
-                    error_type=type(e).__name__,
-                    error_message=str(e),
-                    image_id=str(image.id),
-                    storage_path=image.storage_path,
-                    task_id=str(task.id),
-                )
-                # Task will be returned without image URLs
+        # Rows come from our own database, so skip re-validating them
+        extra: Dict[str, Any] = {}
+
+        # Populate image URLs if available; the proxy endpoint is used instead
+        # of direct Supabase URLs, so no storage call is needed
+        if task.source_image_id in existing_image_ids:
+            proxy_url = f"/api/images/proxy/{task.source_image_id}"
+            extra["image_url"] = proxy_url
+            extra["thumbnail_url"] = proxy_url
 
         # Populate location data if available
         if task.location_id and task.location_id in locations:
-            task_dict["location"] = Location.model_validate(locations[task.location_id])
+            extra["location"] = locations[task.location_id]
 
         # Add snooze options to all tasks
-        task_dict["snooze_options"] = serializable_snooze_options
+        extra["snooze_options"] = task_snooze_options
 
-        task_models.append(Task(**task_dict))
+        task_models.append(Task.from_db_row(task, **extra))
 
     return task_models
 
 
+def _json_response(content: bytes, if_none_match: Optional[str] = None) -> Response:
+    """Send already-encoded JSON with an ETag, or a bare 304 if the client has it.
+
+    The ETag hashes the body itself: responses also carry date-dependent
+    snooze options and joined location data, so row timestamps alone can't
+    tell whether the client's copy is still current.
+    """
+    etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+    if if_none_match:
+        # If-None-Match uses weak comparison and may list several tags
+        client_tags = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        if etag in client_tags or "*" in client_tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=content, media_type="application/json", headers={"ETag": etag}
+    )
+
+
+def _task_list_response(
+    tasks: List[Task], if_none_match: Optional[str] = None
+) -> Response:
+    """Serialize a task list straight to JSON.
+
+    The tasks were just built from trusted rows, so this skips FastAPI's
+    response_model re-validation and encodes the list in a single pass.
+    """
+    return _json_response(TASK_LIST_ADAPTER.dump_json(tasks), if_none_match)
+
+
+async def _fetch_tasks_with_image_ids(
+    session: AsyncSession, query: Select[Any], params: Optional[Dict[str, Any]] = None
+) -> Tuple[List[TaskModel], Set[uuid.UUID]]:
+    """
+    Run a task query with source images outer-joined in.
+
+    Returns the tasks and the IDs of their images that still exist, so
+    populate_task_related_data can skip its separate image query.
+    """
+    result = await session.execute(
+        query.add_columns(ImageModel.id).outerjoin(
+            ImageModel, TaskModel.source_image_id == ImageModel.id
+        ),
+        params,
+    )
+    tasks: List[TaskModel] = []
+    image_ids: Set[uuid.UUID] = set()
+    for task, image_id in result:
+        tasks.append(task)
+        if image_id is not None:
+            image_ids.add(image_id)
+    return tasks, image_ids
+
+
 # For now, we'll use a header for user_id (we'll add proper auth later)
 @router.get("/", response_model=List[Task])
 async def get_tasks(
@@ -179,6 +247,7 @@ async def get_tasks(
         None, description="Filter by source (manual or ai_generated)"
     ),
     accept_language: Optional[str] = Header(None, alias="accept-language"),
+    if_none_match: Optional[str] = Header(None, alias="if-none-match"),
     session: AsyncSession = Depends(get_session_dependency),
 ):
     # Detect locale and get metadata in one call
@@ -197,8 +266,7 @@ async def get_tasks(
 
     # Execute query
     query = select(TaskModel).where(and_(*conditions))
-    result = await session.execute(query)
-    tasks = result.scalars().all()
+    tasks, image_ids = await _fetch_tasks_with_image_ids(session, query)
 
     # Log locale information for monitoring
     logger.info(
@@ -210,13 +278,17 @@ async def get_tasks(
     # Populate image URLs, location data, and snooze options
     # Convert locale to locale_str format expected by snooze service
     locale_str = get_locale_string(detected_locale)
-    return await populate_task_related_data(tasks, session, locale_str)
+    task_models = await populate_task_related_data(
+        tasks, session, locale_str, image_ids
+    )
+    return _task_list_response(task_models, if_none_match)
 
 
 @router.get("/active", response_model=List[Task])
 async def get_active_tasks(
     current_user: UserModel = Depends(get_current_user),
     accept_language: Optional[str] = Header(None, alias="accept-language"),
+    if_none_match: Optional[str] = Header(None, alias="if-none-match"),
     session: AsyncSession = Depends(get_session_dependency),
 ):
     # Detect locale and get metadata in one call
@@ -229,8 +301,7 @@ async def get_active_tasks(
             TaskModel.user_id == current_user.id, TaskModel.status == TaskStatus.ACTIVE
         )
     )
-    result = await session.execute(query)
-    tasks = result.scalars().all()
+    tasks, image_ids = await _fetch_tasks_with_image_ids(session, query)
 
     # Log locale information for monitoring
     logger.info(
@@ -241,13 +312,17 @@ async def get_active_tasks(
 
     # Convert locale to locale_str format expected by snooze service
     locale_str = get_locale_string(detected_locale)
-    return await populate_task_related_data(tasks, session, locale_str)
+    task_models = await populate_task_related_data(
+        tasks, session, locale_str, image_ids
+    )
+    return _task_list_response(task_models, if_none_match)
 
 
 @router.get("/snoozed", response_model=List[Task])
 async def get_snoozed_tasks(
     current_user: UserModel = Depends(get_current_user),
     accept_language: Optional[str] = Header(None, alias="accept-language"),
+    if_none_match: Optional[str] = Header(None, alias="if-none-match"),
     session: AsyncSession = Depends(get_session_dependency),
 ):
     # Detect locale and get metadata in one call
@@ -260,8 +335,7 @@ async def get_snoozed_tasks(
             TaskModel.user_id == current_user.id, TaskModel.status == TaskStatus.SNOOZED
         )
     )
-    result = await session.execute(query)
-    tasks = result.scalars().all()
+    tasks, image_ids = await _fetch_tasks_with_image_ids(session, query)
 
     # Log locale information for monitoring
     logger.info(
@@ -272,7 +346,10 @@ async def get_snoozed_tasks(
 
     # Convert locale to locale_str format expected by snooze service
     locale_str = get_locale_string(detected_locale)
-    return await populate_task_related_data(tasks, session, locale_str)
+    task_models = await populate_task_related_data(
+        tasks, session, locale_str, image_ids
+    )
+    return _task_list_response(task_models, if_none_match)
 
 
 @router.post("/", response_model=Task)
@@ -281,10 +358,8 @@ async def create_task(
     current_user: UserModel = Depends(get_current_user),
     session: AsyncSession = Depends(get_session_dependency),
 ):
-    # Convert task_types enum list to string list for JSONB storage
-    task_types_str = []
-    if task.task_types:
-        task_types_str = [tt.value for tt in task.task_types]
+    # TaskType members are strings, so the list is stored as-is
+    task_types_str = list(task.task_types or ())
 
     # Create new task instance
     db_task = TaskModel(
@@ -323,6 +398,7 @@ async def get_task(
     task_id: int,
     current_user: UserModel = Depends(get_current_user),
     accept_language: Optional[str] = Header(None, alias="accept-language"),
+    if_none_match: Optional[str] = Header(None, alias="if-none-match"),
     session: AsyncSession = Depends(get_session_dependency),
 ):
     # Detect locale and get metadata in one call
@@ -330,13 +406,11 @@ async def get_task(
         session, current_user.id, accept_language
     )
 
-    query = select(TaskModel).where(
-        and_(TaskModel.id == task_id, TaskModel.user_id == current_user.id)
+    # Task and its image come back in one round trip
+    tasks, image_ids = await _fetch_tasks_with_image_ids(
+        session, _OWNED_TASK_STMT, {"task_id": task_id, "uid": current_user.id}
     )
-    result = await session.execute(query)
-    task = result.scalar_one_or_none()
-
-    if not task:
+    if not tasks:
         raise HTTPException(status_code=404, detail="Task not found")
 
     # Log locale information for monitoring
@@ -349,8 +423,52 @@ async def get_task(
     # Populate image URLs, location data, and snooze options for single task
     # Convert locale to locale_str format expected by snooze service
     locale_str = get_locale_string(detected_locale)
-    tasks_with_data = await populate_task_related_data([task], session, locale_str)
-    return tasks_with_data[0]
+    tasks_with_data = await populate_task_related_data(
+        tasks, session, locale_str, image_ids
+    )
+    return _json_response(TASK_ADAPTER.dump_json(tasks_with_data[0]), if_none_match)
+
+
+async def _get_user_task(
+    session: AsyncSession, task_id: int, user_id: uuid.UUID
+) -> TaskModel:
+    """Load one of the user's tasks, raising 404 if it isn't theirs or is gone."""
+    result = await session.execute(
+        _OWNED_TASK_STMT, {"task_id": task_id, "uid": user_id}
+    )
+    task = result.scalar_one_or_none()
+
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+
+async def _update_user_task(
+    session: AsyncSession, task_id: int, user_id: uuid.UUID, values: Dict[str, Any]
+) -> TaskModel:
+    """
+    Apply ``values`` to one of the user's tasks and return the updated row.
+
+    Uses a single UPDATE ... RETURNING instead of loading the row first;
+    raises 404 when the task does not exist or belongs to someone else.
+    """
+    if not values:
+        # Nothing to change; don't bump updated_at
+        return await _get_user_task(session, task_id, user_id)
+
+    result = await session.execute(
+        update(TaskModel)
+        .where(and_(TaskModel.id == task_id, TaskModel.user_id == user_id))
+        .values(**values)
+        .returning(TaskModel)
+    )
+    db_task = result.scalar_one_or_none()
+
+    if not db_task:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    await session.commit()
+    return db_task
 
 
 @router.put("/{task_id}", response_model=Task)
@@ -360,36 +478,25 @@ async def update_task(
     current_user: UserModel = Depends(get_current_user),
     session: AsyncSession = Depends(get_session_dependency),
 ):
-    # Get existing task
-    query = select(TaskModel).where(
-        and_(TaskModel.id == task_id, TaskModel.user_id == current_user.id)
-    )
-    result = await session.execute(query)
-    db_task = result.scalar_one_or_none()
-
-    if not db_task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    # Update fields
+    # Collect column values in field-definition order: explicit status and
+    # snoozed_until override the values derived from completed, because
+    # TaskUpdate declares them after it
     task_data = task.model_dump(exclude_unset=True)
+    values: Dict[str, Any] = {}
 
     for field, value in task_data.items():
-        if field == "task_types" and value is not None:
-            # Convert task_types enum list to string list for JSONB storage
-            setattr(db_task, field, [tt.value for tt in value])
-        elif field == "completed" and value is not None:
+        if field == "completed" and value is not None:
             # Handle status transitions
-            setattr(db_task, field, value)
+            values[field] = value
             if value:
-                db_task.status = TaskStatus.COMPLETED
+                values["status"] = TaskStatus.COMPLETED
             else:
-                db_task.status = TaskStatus.ACTIVE
-                db_task.snoozed_until = None
+                values["status"] = TaskStatus.ACTIVE
+                values["snoozed_until"] = None
         else:
-            setattr(db_task, field, value)
+            values[field] = value
 
-    await session.commit()
-    await session.refresh(db_task)
+    db_task = await _update_user_task(session, task_id, current_user.id, values)
 
     # Populate related data before returning
     tasks_with_data = await populate_task_related_data([db_task], session)
@@ -402,17 +509,16 @@ async def delete_task(
     current_user: UserModel = Depends(get_current_user),
     session: AsyncSession = Depends(get_session_dependency),
 ):
-    # Get existing task
-    query = select(TaskModel).where(
-        and_(TaskModel.id == task_id, TaskModel.user_id == current_user.id)
+    stmt = (
+        delete(TaskModel)
+        .where(and_(TaskModel.id == task_id, TaskModel.user_id == current_user.id))
+        .returning(TaskModel.id)
     )
-    result = await session.execute(query)
-    db_task = result.scalar_one_or_none()
+    result = await session.execute(stmt)
 
-    if not db_task:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    await session.delete(db_task)
     await session.commit()
     return {"message": "Task deleted successfully"}
 
@@ -431,16 +537,6 @@ async def snooze_task(
     )
     locale_str = get_locale_string(detected_locale)
 
-    # Get existing task
-    query = select(TaskModel).where(
-        and_(TaskModel.id == task_id, TaskModel.user_id == current_user.id)
-    )
-    result = await session.execute(query)
-    db_task = result.scalar_one_or_none()
-
-    if not db_task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
     # Determine snooze_until date
     if snooze_request.snooze_option:
         # Use predefined snooze option
@@ -467,11 +563,12 @@ async def snooze_task(
         f"Accept-Language: {accept_language}, Snooze until: {snooze_until}"
     )
 
-    db_task.status = TaskStatus.SNOOZED
-    db_task.snoozed_until = snooze_until
-
-    await session.commit()
-    await session.refresh(db_task)
+    db_task = await _update_user_task(
+        session,
+        task_id,
+        current_user.id,
+        {"status": TaskStatus.SNOOZED, "snoozed_until": snooze_until},
+    )
 
     # Populate related data before returning
     tasks_with_data = await populate_task_related_data([db_task], session, locale_str)
@@ -484,21 +581,12 @@ async def unsnooze_task(
     current_user: UserModel = Depends(get_current_user),
     session: AsyncSession = Depends(get_session_dependency),
 ):
-    # Get existing task
-    query = select(TaskModel).where(
-        and_(TaskModel.id == task_id, TaskModel.user_id == current_user.id)
+    db_task = await _update_user_task(
+        session,
+        task_id,
+        current_user.id,
+        {"status": TaskStatus.ACTIVE, "snoozed_until": None},
     )
-    result = await session.execute(query)
-    db_task = result.scalar_one_or_none()
-
-    if not db_task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    db_task.status = TaskStatus.ACTIVE
-    db_task.snoozed_until = None
-
-    await session.commit()
-    await session.refresh(db_task)
 
     # Populate related data before returning
     tasks_with_data = await populate_task_related_data([db_task], session)
@@ -520,20 +608,41 @@ async def create_ai_task(
     return created_task
 
 
+# Upper bound on tasks per batch request, so one call can't insert without limit
+MAX_AI_TASK_BATCH = 50
+
+
+@router.post("/ai-generated/batch", response_model=List[Task])
+async def create_ai_tasks_batch(
+    tasks: Annotated[
+        List[AITaskCreate], Field(min_length=1, max_length=MAX_AI_TASK_BATCH)
+    ],
+    current_user: UserModel = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session_dependency),
+):
+    """Create several AI tasks (e.g. all tasks found in one image) at once"""
+    # The whole batch goes out as a single multi-row INSERT
+    created_tasks = await TaskService.create_ai_tasks(session, tasks, current_user.id)
+    return _task_list_response([Task.from_db_row(task) for task in created_tasks])
+
+
 @router.get("/ai-generated/with-images", response_model=List[Task])
 async def get_ai_tasks_with_images(
     current_user: UserModel = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None, alias="if-none-match"),
     session: AsyncSession = Depends(get_session_dependency),
 ):
     """Get all AI-generated tasks with their source image details"""
-    # Note: For now, return tasks without image joins
-    # TODO: Add proper join with Image model when needed
     query = select(TaskModel).where(
         and_(
             TaskModel.user_id == current_user.id,
             TaskModel.source == TaskSource.AI_GENERATED,
         )
     )
-    result = await session.execute(query)
-    tasks = result.scalars().all()
-    return tasks
+    tasks, image_ids = await _fetch_tasks_with_image_ids(session, query)
+
+    # Source images are fetched in one IN query for all tasks, not per task
+    tasks_with_data = await populate_task_related_data(
+        tasks, session, image_ids=image_ids
+    )
+    return _task_list_response(tasks_with_data, if_none_match)
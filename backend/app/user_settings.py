@@ -49,7 +49,8 @@ async def get_user_settings(
         )
 
         logger.info(
-            f"Retrieved user settings for {current_user.id}",
+            "Retrieved user settings for %s",
+            current_user.id,
             extra={
                 "user_id": str(current_user.id),
                 "locale_preference": user.locale_preference,
@@ -125,7 +126,8 @@ async def update_user_settings(
         )
 
         logger.info(
-            f"Updated user settings for {current_user.id}",
+            "Updated user settings for %s",
+            current_user.id,
             extra={
                 "user_id": str(current_user.id),
                 "old_locale_preference": old_locale_preference,
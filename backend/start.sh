@@ -6,4 +6,5 @@ echo "Running database migrations..."
 uv run alembic upgrade head
 
 echo "Starting application..."
-exec uv run uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
\ No newline at end of file
+# uvloop and httptools ship with uvicorn[standard]; pin them explicitly
+exec uv run uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000} --loop uvloop --http httptools
\ No newline at end of file
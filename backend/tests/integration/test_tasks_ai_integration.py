@@ -208,12 +208,84 @@ class TestTasksAIIntegration:
         assert len(tasks) == 1
         assert tasks[0]["title"] == "Fix water damage"
         assert tasks[0]["source_image_id"] == str(image_id)
-
-        # Note: The actual image data in the response depends on Supabase's
-        # foreign key expansion behavior
+        assert tasks[0]["image_url"] == f"/api/images/proxy/{image_id}"
 
         # Cleanup is handled by test transaction rollback
 
+    @pytest.mark.asyncio
+    async def test_create_ai_tasks_batch(
+        self, client, setup_test_user, auth_headers: dict, db_session
+    ):
+        """Test creating several AI tasks from one image in a single request."""
+        from app.database import Image as ImageModel
+
+        image_id = uuid.uuid4()
+        db_image = ImageModel(
+            id=image_id,
+            user_id=uuid.UUID(setup_test_user),
+            filename="batch.jpg",
+            content_type="image/jpeg",
+            file_size=4096,
+            storage_path=f"images/{setup_test_user}/{str(image_id)}",
+            analysis_status="completed",
+        )
+        db_session.add(db_image)
+        await db_session.commit()
+
+        tasks_data = [
+            {
+                "title": "Clean oven",
+                "source": "ai_generated",
+                "source_image_id": str(image_id),
+                "ai_confidence": 0.9,
+                "ai_provider": "gemini",
+            },
+            {
+                "title": "Descale kettle",
+                "source": "ai_generated",
+                "source_image_id": str(image_id),
+                "ai_confidence": 0.3,
+                "ai_provider": "gemini",
+            },
+        ]
+
+        response = await client.post(
+            "/api/tasks/ai-generated/batch",
+            json=tasks_data,
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [t["title"] for t in data] == ["Clean oven", "Descale kettle"]
+        assert [t["priority"] for t in data] == ["high", "low"]
+        assert all(t["id"] for t in data)
+
+        response = await client.get(
+            "/api/tasks/?source=ai_generated", headers=auth_headers
+        )
+        assert len(response.json()) == 2
+
+    @pytest.mark.asyncio
+    async def test_create_ai_tasks_batch_rejects_empty_or_oversized(
+        self, client, setup_test_user, auth_headers: dict
+    ):
+        """Test that an empty or oversized batch is rejected before any insert."""
+        from app.tasks import MAX_AI_TASK_BATCH
+
+        task_data = {"title": "Batch task", "source": "ai_generated"}
+
+        for batch in ([], [task_data] * (MAX_AI_TASK_BATCH + 1)):
+            response = await client.post(
+                "/api/tasks/ai-generated/batch",
+                json=batch,
+                headers=auth_headers,
+            )
+            assert response.status_code == 422
+
+        response = await client.get("/api/tasks/", headers=auth_headers)
+        assert response.json() == []
+
     @pytest.mark.asyncio
     async def test_create_regular_task_has_manual_source(
         self, client, setup_test_user, auth_headers: dict
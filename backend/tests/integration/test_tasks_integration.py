@@ -209,6 +209,36 @@ class TestTasksIntegration:
         assert any(t["title"] == "Active Manual Task" for t in active_manual_tasks)
         assert not any(t["title"] == "Active AI Task" for t in active_manual_tasks)
 
+    async def test_task_etag_not_modified(
+        self, client, test_user_id, db_session, auth_headers: dict
+    ):
+        """Test that unchanged task responses are answered with 304."""
+        create_response = await client.post(
+            "/api/tasks/", json={"title": "Cached task"}, headers=auth_headers
+        )
+        task_id = create_response.json()["id"]
+
+        for url in ("/api/tasks/", f"/api/tasks/{task_id}"):
+            first = await client.get(url, headers=auth_headers)
+            etag = first.headers["etag"]
+
+            cached = await client.get(
+                url, headers={**auth_headers, "If-None-Match": f"W/{etag}"}
+            )
+            assert cached.status_code == 304
+            assert cached.content == b""
+            assert cached.headers["etag"] == etag
+
+        # Changing the task changes the body, so the old ETag no longer matches
+        await client.put(
+            f"/api/tasks/{task_id}", json={"title": "Renamed"}, headers=auth_headers
+        )
+        response = await client.get(
+            f"/api/tasks/{task_id}", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
     async def test_task_with_location_integration(
         self, client, test_user_id, db_session, auth_headers: dict
     ):
@@ -0,0 +1,119 @@
+"""Unit tests for the CORS middleware configuration."""
+
+import pytest
+from httpx import AsyncClient
+
+from app.middleware import AppCORSMiddleware
+
+ORIGIN = "http://localhost:3000"
+
+
+@pytest.mark.unit
+class TestCORSMiddleware:
+    """Test CORS handling on API and exempt paths."""
+
+    async def test_api_route_gets_cors_headers(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test that API routes echo back an allowed origin."""
+        response = await client.get(
+            "/locations/", headers={**auth_headers, "Origin": ORIGIN}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+
+    async def test_preflight_allowed_origin(self, client: AsyncClient):
+        """Test that preflight requests from allowed origins succeed."""
+        response = await client.options(
+            "/api/tasks/",
+            headers={"Origin": ORIGIN, "Access-Control-Request-Method": "POST"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+
+    async def test_exempt_path_skips_cors(self, client: AsyncClient):
+        """Test that exempt paths are passed through without CORS headers."""
+        response = await client.get("/", headers={"Origin": ORIGIN})
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+        assert "vary" not in response.headers
+
+    async def test_railway_preview_origin_allowed(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test that Railway preview origins match the origin regex."""
+        origin = "https://todo-house-pr-42.up.railway.app"
+        response = await client.get(
+            "/locations/", headers={**auth_headers, "Origin": origin}
+        )
+
+        assert response.headers["access-control-allow-origin"] == origin
+
+    async def test_unknown_origin_not_allowed(
+        self, client: AsyncClient, auth_headers: dict
+    ):
+        """Test that unknown origins don't get an allow-origin header."""
+        response = await client.get(
+            "/locations/", headers={**auth_headers, "Origin": "https://evil.example"}
+        )
+
+        assert "access-control-allow-origin" not in response.headers
+
+
+@pytest.mark.unit
+def test_origin_check_is_memoized():
+    """Test that repeated origins are answered from the per-instance cache."""
+    middleware = AppCORSMiddleware(
+        app=None, allow_origins=[ORIGIN], allow_origin_regex=r"https://.*\.example"
+    )
+
+    assert middleware.is_allowed_origin(ORIGIN)
+    assert middleware.is_allowed_origin(ORIGIN)
+    assert middleware.is_allowed_origin("https://a.example")
+    assert not middleware.is_allowed_origin("https://other.test")
+
+    info = middleware._origin_allowed.cache_info()
+    assert info.hits == 1
+    assert info.misses == 3
+
+
+@pytest.mark.unit
+def test_cors_header_values_prebuilt_at_init():
+    """Test that joined CORS header values are built once, not per response."""
+    middleware = AppCORSMiddleware(
+        app=None,
+        allow_origins=[ORIGIN],
+        allow_methods=["GET", "POST"],
+        allow_credentials=True,
+        expose_headers=["X-Request-ID", "ETag"],
+        max_age=300,
+    )
+
+    assert middleware.preflight_headers["Access-Control-Allow-Methods"] == "GET, POST"
+    assert middleware.preflight_headers["Access-Control-Max-Age"] == "300"
+    assert (
+        middleware.simple_headers["Access-Control-Expose-Headers"]
+        == "X-Request-ID, ETag"
+    )
+
+
+@pytest.mark.unit
+def test_build_cors_origins_strips_and_deduplicates(monkeypatch):
+    """Test that configured origins are parsed once into a clean list."""
+    from app.main import _build_cors_origins
+
+    monkeypatch.setenv(
+        "CORS_ORIGINS", " https://app.example , https://todo.house,,https://app.example"
+    )
+
+    origins = _build_cors_origins()
+
+    assert origins == [
+        "https://app.example",
+        "https://todo.house",
+        "https://dev.todo.house",
+        "https://www.todo.house",
+    ]
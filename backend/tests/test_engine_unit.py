@@ -3,7 +3,8 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import logging
-from app.database.engine import create_engine
+from sqlalchemy.pool import NullPool
+from app.database.engine import _json_serializer, create_engine
 
 
 @pytest.mark.unit
@@ -90,3 +91,83 @@ def test_database_url_logging_handles_invalid_urls(caplog):
                 "Created database engine (credentials masked)" in msg
                 for msg in log_messages
             ), f"Expected generic message not found. Logs: {log_messages}"
+
+
+@pytest.mark.unit
+def test_postgres_engine_uses_pool_settings():
+    """Test that pool settings from config are passed to the engine."""
+    with patch("app.database.engine.config") as mock_config:
+        with patch("app.database.engine.create_async_engine") as mock_create:
+            mock_config.database.database_url = (
+                "postgresql://user:pw@db.example.com/app"
+            )
+            mock_config.database.echo = False
+            mock_config.database.pool_size = 20
+            mock_config.database.max_overflow = 20
+            mock_config.database.pool_pre_ping = True
+            mock_config.database.pool_recycle = 1800
+            mock_config.database.pool_timeout = 30
+            mock_config.database.transaction_pooler = False
+
+            mock_create.return_value = MagicMock()
+            create_engine()
+
+            _, kwargs = mock_create.call_args
+            assert kwargs["pool_size"] == 20
+            assert kwargs["max_overflow"] == 20
+            assert kwargs["pool_pre_ping"] is True
+            assert kwargs["pool_recycle"] == 1800
+            assert kwargs["pool_timeout"] == 30
+
+
+@pytest.mark.unit
+def test_transaction_pooler_disables_pool_and_statement_cache():
+    """Test that a transaction-mode pooler gets NullPool and no prepared statements."""
+    with patch("app.database.engine.config") as mock_config:
+        with patch("app.database.engine.create_async_engine") as mock_create:
+            mock_config.database.database_url = (
+                "postgresql://user:pw@pooler.example.com:6543/app"
+            )
+            mock_config.database.echo = False
+            mock_config.database.transaction_pooler = True
+
+            mock_create.return_value = MagicMock()
+            create_engine()
+
+            _, kwargs = mock_create.call_args
+            assert kwargs["poolclass"] is NullPool
+            assert kwargs["connect_args"] == {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+            }
+            assert "pool_size" not in kwargs
+
+
+@pytest.mark.unit
+async def test_json_columns_round_trip_through_orjson():
+    """Test that JSON column values are encoded and decoded by the engine."""
+    from sqlalchemy import JSON, Column, Integer, MetaData, Table, insert, select
+
+    with patch("app.database.engine.config") as mock_config:
+        mock_config.database.database_url = "sqlite+aiosqlite:///:memory:"
+        mock_config.database.echo = False
+        engine = create_engine()
+
+    table = Table(
+        "json_round_trip",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("data", JSON),
+    )
+    value = {"type": "checklist", "items": [{"text": "Milk", "completed": False}]}
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(table.metadata.create_all)
+            await conn.execute(insert(table).values(id=1, data=value))
+            stored = await conn.scalar(select(table.c.data))
+    finally:
+        await engine.dispose()
+
+    assert stored == value
+    assert engine.dialect._json_serializer is _json_serializer
+    assert _json_serializer({1: "a"}) == '{"1":"a"}'
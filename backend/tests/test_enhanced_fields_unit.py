@@ -2,6 +2,7 @@
 
 from datetime import datetime, timezone
 import pytest
+from pydantic import ValidationError
 from app.models import (
     TaskCreate,
     TaskUpdate,
@@ -170,3 +171,53 @@ def test_null_fields_handling():
 
     assert task.schedule is None
     assert task.content is None
+
+
+@pytest.mark.unit
+def test_dict_fields_validated_by_type_tag():
+    """Test that raw dicts are validated against the model named by their type."""
+    task = TaskCreate(
+        title="From JSON",
+        schedule={"type": "once", "date": "2025-08-15T10:00:00Z"},
+        content={"type": "checklist", "items": [{"text": "First item"}]},
+    )
+
+    assert task.schedule == {"type": "once", "date": "2025-08-15T10:00:00Z"}
+    # Defaults from ChecklistItem are filled in
+    assert task.content["items"][0]["completed"] is False
+    assert "id" in task.content["items"][0]
+
+
+@pytest.mark.unit
+def test_untyped_dict_fields_stored_as_is():
+    """Test that dicts without a matching model fall back to plain dicts."""
+    note = {"type": ContentType.NOTE.value, "text": "Remember the filter"}
+    incomplete = {"type": ScheduleType.ONCE.value}
+
+    task = TaskCreate(title="Note", content=note, schedule=incomplete)
+
+    assert task.content == note
+    assert task.schedule == incomplete
+
+
+@pytest.mark.unit
+def test_checklist_item_ids_are_unique_hex():
+    """Test that generated checklist item IDs are unique hex strings."""
+    first, second = ChecklistItem(text="a"), ChecklistItem(text="b")
+
+    assert first.id != second.id
+    assert len(first.id) == 32
+    int(first.id, 16)
+
+
+@pytest.mark.unit
+def test_list_items_are_hashable_for_dedup():
+    """Test that checklist and shopping list items can be deduplicated in sets."""
+    item = ShoppingListItem(name="Tape", quantity="2 rolls")
+
+    assert len({item, ShoppingListItem(name="Tape", quantity="2 rolls")}) == 1
+    assert hash(ChecklistItem(id="1", text="a")) == hash(
+        ChecklistItem(id="1", text="a")
+    )
+    with pytest.raises(ValidationError):
+        item.purchased = True
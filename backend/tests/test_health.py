@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import AsyncMock, patch
 from httpx import AsyncClient
 
 
@@ -17,3 +18,118 @@ async def test_health_check(client: AsyncClient):
 
     data = response.json()
     assert data["status"] in ["healthy", "error"]
+
+
+@pytest.mark.asyncio
+async def test_health_check_reuses_healthy_result(client: AsyncClient):
+    """Test that a healthy result is served from cache within the TTL."""
+    from app import main
+
+    main._health_cache.update(ts=0.0, val=None)
+    healthy = {"status": "healthy", "database": "connected", "sqlalchemy": "connected"}
+
+    with patch.object(main, "_check_health", AsyncMock(return_value=healthy)) as check:
+        first = await client.get("/api/health")
+        second = await client.get("/api/health")
+
+    assert first.json() == second.json() == healthy
+    check.assert_awaited_once()
+    main._health_cache.update(ts=0.0, val=None)
+
+
+@pytest.mark.asyncio
+async def test_health_check_does_not_cache_errors(client: AsyncClient):
+    """Test that failing checks are retried on the next probe."""
+    from app import main
+
+    main._health_cache.update(ts=0.0, val=None)
+    error = {"status": "error", "database": "error: down"}
+
+    with patch.object(main, "_check_health", AsyncMock(return_value=error)) as check:
+        await client.get("/api/health")
+        await client.get("/api/health")
+
+    assert check.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_robots_txt_served_from_static_file(client: AsyncClient):
+    """robots.txt is served from the bundled static file"""
+    from pathlib import Path
+
+    import app.main as main_module
+
+    response = await client.get("/robots.txt")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    expected = (
+        Path(main_module.__file__).parent / "static" / "robots.txt"
+    ).read_bytes()
+    assert response.content == expected
+
+
+@pytest.mark.asyncio
+async def test_liveness_check_skips_database(client: AsyncClient):
+    """The liveness probe answers without running a database check"""
+    import app.main as main
+
+    with patch.object(main, "_check_health", AsyncMock()) as check:
+        response = await client.get("/api/health/live")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy"}
+    check.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_closes_engine_on_shutdown():
+    """The lifespan handler disposes the database engine on shutdown"""
+    import app.main as main
+
+    with (
+        patch.object(main, "close_engine", AsyncMock()) as close,
+        patch.object(main, "stop_logging") as stop,
+    ):
+        async with main.lifespan(main.app):
+            close.assert_not_awaited()
+
+    close.assert_awaited_once()
+    stop.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_cleans_up_when_serving_fails():
+    """Shutdown cleanup still runs if the app exits with an error"""
+    import app.main as main
+
+    with (
+        patch.object(main, "close_engine", AsyncMock()) as close,
+        patch.object(main, "stop_logging") as stop,
+    ):
+        with pytest.raises(RuntimeError):
+            async with main.lifespan(main.app):
+                raise RuntimeError("server crashed")
+
+    close.assert_awaited_once()
+    stop.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_health_check_reports_missing_database_url():
+    """The DATABASE_URL check uses the config loaded at startup"""
+    import app.main as main
+
+    with patch.object(main.config.database, "database_url", ""):
+        result = await main._check_health()
+
+    assert result == {"status": "error", "message": "Missing DATABASE_URL"}
+
+
+@pytest.mark.asyncio
+async def test_root_returns_prebuilt_json(client: AsyncClient):
+    """The root endpoint returns its constant JSON body"""
+    response = await client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"message": "todo.house API is running!"}
@@ -25,7 +25,8 @@ class TestLocationsCoverage:
             assert response.status_code == 201
             # Check that logger.info was called
             mock_logger.info.assert_called_once()
-            log_message = mock_logger.info.call_args[0][0]
+            log_format, *log_args = mock_logger.info.call_args[0]
+            log_message = log_format % tuple(log_args)
             assert "Created location" in log_message
             assert str(test_user_id) in log_message
 
@@ -269,3 +270,17 @@ class TestLocationsCoverage:
             # Verify timestamps exist
             assert "created_at" in loc
             assert "updated_at" in loc
+
+    async def test_list_locations_virtual_default_ids_are_stable(
+        self, client, auth_headers: dict
+    ):
+        """Test that virtual default IDs are the same across list calls."""
+        first = await client.get("/locations/", headers=auth_headers)
+        second = await client.get("/locations/", headers=auth_headers)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        first_ids = {loc["name"]: loc["id"] for loc in first.json()}
+        second_ids = {loc["name"]: loc["id"] for loc in second.json()}
+        assert first_ids == second_ids
+        assert len(set(first_ids.values())) == len(first_ids)
@@ -1,7 +1,7 @@
 import pytest
 from datetime import datetime
 from babel import Locale
-from app.services.snooze_service import SnoozeService, SnoozeOption
+from app.services.snooze_service import SnoozeChoice, SnoozeService, SnoozeOption
 
 
 @pytest.mark.unit
@@ -29,9 +29,9 @@ class TestSnoozeService:
 
         context_option = options[SnoozeOption.CONTEXT_SENSITIVE]
         # Should snooze to Saturday (weekend)
-        assert context_option["label"] == "This weekend"
-        assert context_option["date"].weekday() == 5  # Saturday
-        assert context_option["date"].date() == datetime(2025, 1, 18).date()
+        assert context_option.label == "This weekend"
+        assert context_option.date.weekday() == 5  # Saturday
+        assert context_option.date.date() == datetime(2025, 1, 18).date()
 
     def test_context_sensitive_last_workday_us_locale(self):
         """Test context-sensitive snooze on Friday (last workday) in US locale."""
@@ -44,8 +44,8 @@ class TestSnoozeService:
 
         context_option = options[SnoozeOption.CONTEXT_SENSITIVE]
         # Should snooze to tomorrow (Saturday)
-        assert context_option["label"] == "Tomorrow"
-        assert context_option["date"].date() == datetime(2025, 1, 18).date()
+        assert context_option.label == "Tomorrow"
+        assert context_option.date.date() == datetime(2025, 1, 18).date()
 
     def test_context_sensitive_weekend_us_locale(self):
         """Test context-sensitive snooze on Saturday in US locale."""
@@ -58,10 +58,10 @@ class TestSnoozeService:
 
         context_option = options[SnoozeOption.CONTEXT_SENSITIVE]
         # Should snooze to Monday (next workday)
-        assert context_option["label"] == "Next week"
+        assert context_option.label == "Next week"
         # US locale: first workday is Monday (weekday=0)
-        assert context_option["date"].weekday() == 0  # Monday
-        assert context_option["date"].date() == datetime(2025, 1, 20).date()
+        assert context_option.date.weekday() == 0  # Monday
+        assert context_option.date.date() == datetime(2025, 1, 20).date()
 
     def test_context_sensitive_midweek_israel_locale(self):
         """Test context-sensitive snooze on Wednesday in Israel locale."""
@@ -74,9 +74,9 @@ class TestSnoozeService:
 
         context_option = options[SnoozeOption.CONTEXT_SENSITIVE]
         # Should snooze to Friday (weekend in Israel)
-        assert context_option["label"] == "This weekend"
-        assert context_option["date"].weekday() == 4  # Friday
-        assert context_option["date"].date() == datetime(2025, 1, 17).date()
+        assert context_option.label == "This weekend"
+        assert context_option.date.weekday() == 4  # Friday
+        assert context_option.date.date() == datetime(2025, 1, 17).date()
 
     def test_next_week_option(self):
         """Test next week snooze option."""
@@ -89,9 +89,9 @@ class TestSnoozeService:
 
         next_week_option = options[SnoozeOption.NEXT_WEEK]
         # Should snooze to next Monday
-        assert next_week_option["label"] == "Next week"
-        assert next_week_option["date"].weekday() == 0  # Monday
-        assert next_week_option["date"].date() == datetime(2025, 1, 20).date()
+        assert next_week_option.label == "Next week"
+        assert next_week_option.date.weekday() == 0  # Monday
+        assert next_week_option.date.date() == datetime(2025, 1, 20).date()
 
     def test_few_weeks_option(self):
         """Test few weeks snooze option."""
@@ -104,20 +104,20 @@ class TestSnoozeService:
 
         few_weeks_option = options[SnoozeOption.FEW_WEEKS]
         # Should snooze to ~3 weeks from now on a Monday
-        assert few_weeks_option["label"] == "In a few weeks"
-        assert few_weeks_option["date"].weekday() == 0  # Monday
+        assert few_weeks_option.label == "In a few weeks"
+        assert few_weeks_option.date.weekday() == 0  # Monday
         # Should be February 10, 2025 (3 weeks later = Feb 5, adjusted to next Monday)
-        assert few_weeks_option["date"].date() == datetime(2025, 2, 10).date()
+        assert few_weeks_option.date.date() == datetime(2025, 2, 10).date()
 
     def test_later_option(self):
         """Test indefinite later snooze option."""
         options = SnoozeService.calculate_snooze_options()
 
         later_option = options[SnoozeOption.LATER]
-        assert later_option["label"] == "Later"
-        assert later_option["description"] == "Indefinitely snoozed"
+        assert later_option.label == "Later"
+        assert later_option.description == "Indefinitely snoozed"
         # Should be far in the future
-        assert later_option["date"].year == 2099
+        assert later_option.date.year == 2099
 
     def test_get_snooze_date_by_option(self):
         """Test getting specific snooze date by option."""
@@ -133,6 +133,36 @@ class TestSnoozeService:
         assert date.weekday() == 5  # Saturday
         assert date.date() == datetime(2025, 1, 18).date()
 
+    def test_get_snooze_date_by_option_computes_only_that_option(self):
+        """Test that a single option lookup skips the other calculators."""
+        from unittest.mock import patch
+
+        with patch.object(SnoozeService, "_calculate_few_weeks_snooze") as few_weeks:
+            date = SnoozeService.get_snooze_date_by_option(SnoozeOption.LATER)
+
+        few_weeks.assert_not_called()
+        assert date.year == 2099
+
+    def test_snooze_choice_is_immutable(self):
+        """Test that computed choices cannot be modified by callers."""
+        from dataclasses import FrozenInstanceError
+
+        choice = SnoozeService.calculate_snooze_options()[SnoozeOption.LATER]
+        with pytest.raises(FrozenInstanceError):
+            choice.label = "Changed"  # type: ignore[misc]
+
+    def test_snooze_dates_use_default_time(self):
+        """Test that snooze targets land at 9 AM as naive datetimes."""
+        from datetime import timezone
+
+        current_time = datetime(2025, 1, 15, 14, 30, 45, 123, tzinfo=timezone.utc)
+        options = SnoozeService.calculate_snooze_options(current_time)
+
+        for option in (SnoozeOption.CONTEXT_SENSITIVE, SnoozeOption.FEW_WEEKS):
+            date = options[option].date
+            assert date.time() == SnoozeService.DEFAULT_TASK_TIME
+            assert date.tzinfo is None
+
     def test_invalid_snooze_option_raises_error(self):
         """Test that invalid snooze option raises ValueError."""
         with pytest.raises(ValueError, match="Invalid snooze option"):
@@ -213,9 +243,9 @@ class TestSnoozeServiceHelpers:
 
             # Verify all options have required fields
             for option in options.values():
-                assert "date" in option
-                assert "label" in option
-                assert "description" in option
+                assert isinstance(option, SnoozeChoice)
+                assert option.label
+                assert option.description
 
     def test_accept_language_header_format(self):
         """Test that Accept-Language header format is parsed correctly."""
@@ -236,4 +266,44 @@ class TestSnoozeServiceHelpers:
 
             # Verify parsing worked by checking we get valid dates
             for option in options.values():
-                assert isinstance(option["date"], datetime)
+                assert isinstance(option.date, datetime)
+
+    def test_locale_parsed_once_per_identifier(self):
+        """Test that repeated calculations reuse the parsed Babel locale."""
+        from app.services.snooze_service import _locale_info
+
+        _locale_info.cache_clear()
+        for _ in range(3):
+            SnoozeService.calculate_snooze_options(locale_str="en-GB,en;q=0.9")
+
+        assert _locale_info.cache_info().misses == 1
+        assert _locale_info.cache_info().hits == 2
+
+    def test_locale_case_variants_share_cache_entry(self):
+        """Test that hyphen and case variants of a locale resolve once."""
+        from app.services.snooze_service import _locale_info
+
+        _locale_info.cache_clear()
+        for locale_str in ("en-us", "en_US", "EN-us,en;q=0.9"):
+            SnoozeService.calculate_snooze_options(locale_str=locale_str)
+
+        assert _locale_info.cache_info().misses == 1
+        assert _locale_info.cache_info().hits == 2
+
+    def test_locale_info_resolves_week_layout(self):
+        """Test that the cached locale info matches the per-locale helpers."""
+        from app.services.snooze_service import _locale_info
+
+        info = _locale_info("he_IL")
+        locale = Locale.parse("he_IL")
+
+        assert info.first_workday == SnoozeService.get_first_workday(locale)
+        assert info.last_workday == SnoozeService.get_last_workday(locale)
+        assert info.is_weekend(4) and not info.is_weekend(6)
+        assert info.day_name(6, "Weekday") == locale.days["format"]["wide"][6]
+        assert _locale_info("he_IL") is info
+
+        # Thursday is the last Israeli workday, Friday starts the weekend
+        assert info.context_table[3][:2] == (1, "Tomorrow")
+        assert info.next_week_table[4][:2] == (7, "Next weekend")
+        assert len(info.context_table) == len(info.next_week_table) == 7
@@ -100,6 +100,38 @@ class TestTasksCoverage:
         assert response.status_code == 404
         assert response.json()["detail"] == "Task not found"
 
+    async def test_update_task_persists_and_empty_update_is_noop(
+        self, client, test_user_id, auth_headers: dict
+    ):
+        """Test that updates persist and an empty payload leaves the task as-is."""
+        create_resp = await client.post(
+            "/api/tasks/",
+            json={"title": "Original", "task_types": ["interior"]},
+            headers=auth_headers,
+        )
+        task_id = create_resp.json()["id"]
+
+        response = await client.put(
+            f"/api/tasks/{task_id}",
+            json={"title": "Renamed", "task_types": ["plumbing"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "Renamed"
+
+        fetched = (
+            await client.get(f"/api/tasks/{task_id}", headers=auth_headers)
+        ).json()
+        assert fetched["title"] == "Renamed"
+        assert fetched["task_types"] == ["plumbing"]
+
+        response = await client.put(
+            f"/api/tasks/{task_id}", json={}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "Renamed"
+        assert response.json()["updated_at"] == fetched["updated_at"]
+
     async def test_update_task_completed_status_transition(
         self, client, test_user_id, auth_headers: dict
     ):
@@ -107,6 +107,26 @@ class TestPopulateTaskRelatedData:
         assert result[0].location.description == "Main kitchen area"
         assert result[1].location is None
 
+    async def test_shared_location_built_once(self):
+        """Test that tasks in the same location share one Location model."""
+        location_id = uuid.uuid4()
+        user_id = uuid.uuid4()
+        tasks = [
+            MockTaskModel(id=1, location_id=location_id, user_id=user_id),
+            MockTaskModel(id=2, location_id=location_id, user_id=user_id),
+        ]
+        location = MockLocationModel(id=location_id, name="Garage", user_id=user_id)
+
+        session = AsyncMock()
+        location_result = Mock()
+        location_result.scalars.return_value.all.return_value = [location]
+        session.execute.return_value = location_result
+
+        result = await populate_task_related_data(tasks, session)
+
+        assert result[0].location.name == "Garage"
+        assert result[0].location is result[1].location
+
     async def test_location_database_error(self):
         """Test handling of location database errors."""
         location_id = uuid.uuid4()
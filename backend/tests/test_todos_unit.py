@@ -118,8 +118,12 @@ async def test_get_tasks_unit():
     mock_session = AsyncMock()
 
     # Mock the query execution
+    # Tasks come back as (task, image id) rows from the image outer join
     mock_result = MagicMock()
     mock_result.scalars.return_value.all.return_value = mock_tasks
+    mock_result.__iter__.side_effect = lambda: iter(
+        [(task, None) for task in mock_tasks]
+    )
     mock_session.execute = AsyncMock(return_value=mock_result)
 
     async def mock_get_session():
@@ -327,6 +327,20 @@ class TestGeminiProvider:
             assert len(result["tasks"]) == 1  # Only valid task should remain
             assert result["tasks"][0]["title"] == "Valid task"
 
+    def test_gemini_provider_parse_response_invalid_json(self):
+        """Test that malformed JSON surfaces as a provider error."""
+        with (
+            patch("google.generativeai.configure"),
+            patch("google.generativeai.GenerativeModel"),
+        ):
+            provider = GeminiProvider(api_key="test_key")
+
+            mock_response = Mock()
+            mock_response.text = '{"tasks": ['
+
+            with pytest.raises(AIProviderError, match="Invalid JSON response"):
+                provider._parse_response(mock_response)
+
 
 class TestAIProviderFactory:
     """Test the AI provider factory."""
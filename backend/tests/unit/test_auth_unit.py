@@ -393,6 +393,27 @@ class TestGetCurrentUser:
         assert added_user.avatar_url == "https://example.com/avatar.jpg"
 
 
+class TestParseUserUuid:
+    """Test parsing of token subjects into user UUIDs."""
+
+    def test_parses_uuid_subjects_once(self):
+        """Test that UUID subjects are parsed and cached per value."""
+        from app.auth import _parse_user_uuid
+
+        _parse_user_uuid.cache_clear()
+        subject = str(uuid.uuid4())
+
+        assert _parse_user_uuid(subject) == uuid.UUID(subject)
+        assert _parse_user_uuid(subject) == uuid.UUID(subject)
+        assert _parse_user_uuid.cache_info().hits == 1
+
+    def test_non_uuid_subject_returns_none(self):
+        """Test that OAuth provider IDs that aren't UUIDs are reported as None."""
+        from app.auth import _parse_user_uuid
+
+        assert _parse_user_uuid("google-oauth2|1234567890") is None
+
+
 class TestGetOptionalCurrentUser:
     """Test the get_optional_current_user function."""
 
@@ -182,3 +182,18 @@ def test_get_next_scheduled_date():
     # Test empty schedule
     assert get_next_scheduled_date(None) is None
     assert get_next_scheduled_date({}) is None
+
+
+@pytest.mark.unit
+def test_example_tasks_do_not_share_content():
+    """Test that shared example content is copied into each task."""
+    first = create_bathroom_renovation_task()
+    second = create_bathroom_renovation_task()
+
+    first.content["items"][0]["completed"] = True
+
+    assert second.content["items"][0]["completed"] is False
+    # Each task's checklist items get their own IDs
+    first_ids = {item["id"] for item in first.content["items"]}
+    second_ids = {item["id"] for item in second.content["items"]}
+    assert not first_ids & second_ids
@@ -0,0 +1,57 @@
+"""Unit tests for the storage provider."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.storage import SupabaseStorageProvider
+
+
+@pytest.fixture
+def provider_and_bucket():
+    """A Supabase provider whose client is mocked, plus its bucket handle."""
+    with patch("app.storage.create_client") as mock_create_client:
+        client = mock_create_client.return_value
+        provider = SupabaseStorageProvider("images")
+        yield provider, client.storage.from_.return_value, client
+
+
+class TestSupabaseStorageProvider:
+    """Test cases for SupabaseStorageProvider."""
+
+    @pytest.mark.asyncio
+    async def test_upload_and_download_use_cached_bucket_off_loop(
+        self, provider_and_bucket
+    ):
+        """Test that uploads and downloads reuse one bucket handle in a worker thread."""
+        provider, bucket, client = provider_and_bucket
+        loop_thread = threading.current_thread()
+        call_threads = {}
+
+        def fake_upload(**kwargs):
+            call_threads["upload"] = threading.current_thread()
+            return {"path": kwargs["path"]}
+
+        def fake_download(path):
+            call_threads["download"] = threading.current_thread()
+            return b"image-bytes"
+
+        bucket.upload = MagicMock(side_effect=fake_upload)
+        bucket.download = MagicMock(side_effect=fake_download)
+
+        result = await provider.upload(b"data", "user/a.jpg", "image/jpeg")
+        data = await provider.download_file("user/a.jpg")
+
+        assert result == {"path": "user/a.jpg"}
+        assert data == b"image-bytes"
+        bucket.upload.assert_called_once_with(
+            file=b"data",
+            path="user/a.jpg",
+            file_options={"content-type": "image/jpeg", "upsert": "true"},
+        )
+        bucket.download.assert_called_once_with("user/a.jpg")
+        # The bucket handle was built once, at construction
+        client.storage.from_.assert_called_once_with("images")
+        assert call_threads["upload"] is not loop_thread
+        assert call_threads["download"] is not loop_thread
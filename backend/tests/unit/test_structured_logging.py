@@ -2,6 +2,7 @@
 
 import json
 import logging
+import logging.handlers
 from unittest.mock import patch
 import pytest
 
@@ -11,6 +12,7 @@ from app.logging_config import (
     ImageProcessingLogger,
     AIProviderLogger,
     setup_logging,
+    stop_logging,
     generate_correlation_id,
     set_correlation_id,
     get_correlation_id,
@@ -128,6 +130,32 @@ class TestStructuredFormatter:
 class TestStructuredLogger:
     """Test structured logger functionality."""
 
+    def test_is_enabled_for_follows_logger_level(self):
+        """Test is_enabled_for reflects the underlying logger level."""
+        structured_logger = StructuredLogger("test.is_enabled_for")
+        structured_logger.logger.setLevel(logging.INFO)
+
+        assert structured_logger.is_enabled_for(logging.INFO)
+        assert not structured_logger.is_enabled_for(logging.DEBUG)
+
+    def test_exception_attaches_traceback(self):
+        """Test exception() records exc_info for the formatter to render."""
+        structured_logger = StructuredLogger("test.exception")
+        with patch.object(structured_logger.logger, "handle") as mock_handle:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                structured_logger.exception("Failed", user_id="test-user")
+
+        record = mock_handle.call_args[0][0]
+        assert record.levelno == logging.ERROR
+        assert record.exc_info[0] is ValueError
+        assert record.extra_fields == {"user_id": "test-user"}
+
+        log_data = json.loads(StructuredFormatter().format(record))
+        assert log_data["exception"]["type"] == "ValueError"
+        assert "boom" in log_data["exception"]["traceback"]
+
     def test_structured_logger_info(self):
         """Test structured logger info method."""
         with patch("logging.getLogger") as mock_get_logger:
@@ -377,3 +405,65 @@ class TestLoggingSetup:
             formatter_arg = mock_handler.setFormatter.call_args[0][0]
             assert isinstance(formatter_arg, logging.Formatter)
             assert not isinstance(formatter_arg, StructuredFormatter)
+
+    def test_setup_logging_with_queue(self, capsys):
+        """Test queued logging writes structured records from the listener."""
+        root_logger = logging.getLogger()
+        original_handlers = root_logger.handlers[:]
+        original_level = root_logger.level
+        token = set_correlation_id("queued-id")
+        try:
+            setup_logging(log_level="INFO", enable_json=True, use_queue=True)
+            StructuredLogger("test.queue").info("Queued message", user_id="user-1")
+            stop_logging()
+
+            log_data = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+            assert log_data["message"] == "Queued message"
+            assert log_data["user_id"] == "user-1"
+            assert log_data["correlation_id"] == "queued-id"
+        finally:
+            correlation_id.reset(token)
+            stop_logging()
+            root_logger.handlers[:] = original_handlers
+            root_logger.setLevel(original_level)
+
+    def test_queued_record_args_merged_at_call_time(self, capsys):
+        """Test queued records log mutable arguments as they were at the call."""
+        root_logger = logging.getLogger()
+        original_handlers = root_logger.handlers[:]
+        original_level = root_logger.level
+        try:
+            setup_logging(log_level="INFO", enable_json=True, use_queue=True)
+            items = ["a"]
+            logging.getLogger("test.queue").info("Items: %s", items)
+            items.append("b")
+            stop_logging()
+
+            log_data = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+            assert log_data["message"] == "Items: ['a']"
+        finally:
+            stop_logging()
+            root_logger.handlers[:] = original_handlers
+            root_logger.setLevel(original_level)
+
+    def test_stop_logging_restores_direct_handler(self, capsys):
+        """Test records logged after stop_logging are still written."""
+        root_logger = logging.getLogger()
+        original_handlers = root_logger.handlers[:]
+        original_level = root_logger.level
+        try:
+            setup_logging(log_level="INFO", enable_json=True, use_queue=True)
+            stop_logging()
+
+            assert not any(
+                isinstance(h, logging.handlers.QueueHandler)
+                for h in root_logger.handlers
+            )
+            StructuredLogger("test.queue").info("After shutdown")
+
+            log_data = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+            assert log_data["message"] == "After shutdown"
+        finally:
+            stop_logging()
+            root_logger.handlers[:] = original_handlers
+            root_logger.setLevel(original_level)
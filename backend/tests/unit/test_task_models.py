@@ -3,7 +3,14 @@
 import uuid
 import pytest
 from pydantic import ValidationError
-from app.models import TaskCreate, AITaskCreate, Task, TaskSource, TaskPriority
+from app.models import (
+    TaskCreate,
+    AITaskCreate,
+    Task,
+    TaskSource,
+    TaskPriority,
+    TaskType,
+)
 
 
 class TestTaskModels:
@@ -22,6 +29,14 @@ class TestTaskModels:
         assert task.ai_confidence is None
         assert task.ai_provider is None
 
+    def test_task_enums_are_plain_strings(self):
+        """Test that task enum members format and serialize as their values."""
+        assert str(TaskType.PLUMBING) == "plumbing"
+        assert f"{TaskSource.AI_GENERATED}" == "ai_generated"
+        assert list(TaskCreate(title="t", task_types=["repair"]).task_types) == [
+            "repair"
+        ]
+
     def test_task_create_with_ai_fields(self):
         """Test creating a task with AI-related fields."""
         test_image_id = str(uuid.uuid4())
@@ -164,3 +179,55 @@ class TestTaskModels:
         assert task.source_image_id is not None
         assert task.ai_confidence == 0.9
         assert task.ai_provider == "gemini"
+
+    def test_task_from_db_row_matches_validation(self):
+        """Test that from_db_row builds the same task as full validation."""
+        from datetime import datetime
+        from types import SimpleNamespace
+
+        now = datetime.now()
+        row = SimpleNamespace(
+            id=1,
+            user_id=uuid.uuid4(),
+            title="Test task",
+            description=None,
+            priority="high",
+            completed=False,
+            status="snoozed",
+            snoozed_until=now,
+            task_types=["plumbing", "not-a-type"],
+            location_id=None,
+            schedule={"type": "once", "date": "2025-08-15T10:00:00Z"},
+            show_after=None,
+            content=None,
+            metrics={"complexity": "easy"},
+            tags=["kitchen"],
+            source="manual",
+            source_image_id=None,
+            ai_confidence=None,
+            ai_provider=None,
+            created_at=now,
+            updated_at=now,
+        )
+
+        task = Task.from_db_row(row, image_url="/api/images/proxy/1")
+
+        assert task.priority is TaskPriority.HIGH
+        assert task.source is TaskSource.MANUAL
+        assert task.task_types == [TaskType.PLUMBING]
+        assert task.image_url == "/api/images/proxy/1"
+        assert task.location is None
+        assert task.model_dump(mode="json") == Task.model_validate(row).model_copy(
+            update={"image_url": "/api/images/proxy/1"}
+        ).model_dump(mode="json")
+
+    def test_parse_task_types_skips_invalid_values(self, caplog):
+        """Test that task types are looked up by value and unknown ones dropped."""
+        with caplog.at_level("WARNING", logger="app.models"):
+            parsed = Task.parse_task_types(
+                [TaskType.REPAIR, "plumbing", "not-a-type", 42]
+            )
+
+        assert parsed == [TaskType.REPAIR, TaskType.PLUMBING]
+        assert all(isinstance(t, TaskType) for t in parsed)
+        assert "not-a-type" in caplog.text
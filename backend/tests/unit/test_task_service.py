@@ -35,14 +35,26 @@ class TestTaskService:
         assert TaskService.determine_priority_from_confidence(0.3) == TaskPriority.LOW
         assert TaskService.determine_priority_from_confidence(0.59) == TaskPriority.LOW
 
+    def test_determine_priority_from_confidence_boundaries(self):
+        """Test exact thresholds and out-of-range scores."""
+        import math
+
+        just_below_high = math.nextafter(0.8, 0)
+        just_below_medium = math.nextafter(0.6, 0)
+
+        priority = TaskService.determine_priority_from_confidence
+        assert priority(just_below_high) == TaskPriority.MEDIUM
+        assert priority(just_below_medium) == TaskPriority.LOW
+        assert priority(-0.5) == TaskPriority.LOW
+        assert priority(1.5) == TaskPriority.HIGH
+
     @pytest.mark.asyncio
     async def test_create_ai_tasks_single(self):
         """Test creating a single AI-generated task."""
         # Create a mock session
         mock_session = AsyncMock()
-        mock_session.add = MagicMock()
+        mock_session.add_all = MagicMock()
         mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Create test task
         task = AITaskCreate(
@@ -62,11 +74,11 @@ class TestTaskService:
         assert isinstance(result[0], TaskModel)
 
         # Verify database calls
-        mock_session.add.assert_called_once()
+        mock_session.add_all.assert_called_once()
         mock_session.commit.assert_called_once()
 
         # Check the task that was added
-        added_task = mock_session.add.call_args[0][0]
+        (added_task,) = mock_session.add_all.call_args[0][0]
         assert added_task.title == "Fix leaky faucet"
         assert (
             added_task.priority == TaskPriority.HIGH
@@ -78,9 +90,8 @@ class TestTaskService:
         """Test creating multiple AI-generated tasks with different confidence levels."""
         # Create a mock session
         mock_session = AsyncMock()
-        mock_session.add = MagicMock()
+        mock_session.add_all = MagicMock()
         mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Create test tasks with different confidence levels
         tasks = [
@@ -117,11 +128,13 @@ class TestTaskService:
         assert len(result) == 3
 
         # Verify database calls
-        assert mock_session.add.call_count == 3
+        mock_session.add_all.assert_called_once()
         mock_session.commit.assert_called_once()
+        mock_session.execute.assert_not_called()
+        mock_session.refresh.assert_not_called()
 
         # Check priorities set on added tasks
-        added_tasks = [call[0][0] for call in mock_session.add.call_args_list]
+        added_tasks = mock_session.add_all.call_args[0][0]
         assert added_tasks[0].priority == TaskPriority.HIGH
         assert added_tasks[1].priority == TaskPriority.MEDIUM
         assert added_tasks[2].priority == TaskPriority.LOW
@@ -131,9 +144,8 @@ class TestTaskService:
         """Test that explicitly set priority is not overridden by confidence."""
         # Create a mock session
         mock_session = AsyncMock()
-        mock_session.add = MagicMock()
+        mock_session.add_all = MagicMock()
         mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         # Create task with high confidence but explicit low priority
         task = AITaskCreate(
@@ -150,7 +162,7 @@ class TestTaskService:
         await TaskService.create_ai_tasks(mock_session, [task], uuid.uuid4())
 
         # Verify the explicit priority was kept
-        added_task = mock_session.add.call_args[0][0]
+        (added_task,) = mock_session.add_all.call_args[0][0]
         assert added_task.priority == TaskPriority.LOW
 
     @pytest.mark.asyncio
@@ -158,9 +170,8 @@ class TestTaskService:
         """Test the convenience method for creating a single task."""
         # Create a mock session
         mock_session = AsyncMock()
-        mock_session.add = MagicMock()
+        mock_session.add_all = MagicMock()
         mock_session.commit = AsyncMock()
-        mock_session.refresh = AsyncMock()
 
         task = AITaskCreate(
             title="Single task",
@@ -179,7 +190,33 @@ class TestTaskService:
         assert isinstance(result, TaskModel)
 
         # Should have added exactly one task
-        mock_session.add.assert_called_once()
-        added_task = mock_session.add.call_args[0][0]
+        mock_session.add_all.assert_called_once()
+        (added_task,) = mock_session.add_all.call_args[0][0]
         assert added_task.title == "Single task"
         assert added_task.priority == TaskPriority.MEDIUM  # 0.75 confidence = medium
+
+    @pytest.mark.asyncio
+    async def test_create_ai_tasks_loads_generated_fields(
+        self, db_session, setup_test_user, test_user_id
+    ):
+        """Test that batch-created tasks come back with IDs and timestamps."""
+        tasks = [
+            AITaskCreate(
+                title=f"Task {i}",
+                description="Batch created",
+                source_image_id=str(uuid.uuid4()),
+                source=TaskSource.AI_GENERATED,
+                ai_confidence=0.5,
+                ai_provider="gemini",
+            )
+            for i in range(3)
+        ]
+
+        result = await TaskService.create_ai_tasks(
+            db_session, tasks, uuid.UUID(test_user_id)
+        )
+
+        assert [task.title for task in result] == ["Task 0", "Task 1", "Task 2"]
+        assert len({task.id for task in result}) == 3
+        assert all(task.created_at is not None for task in result)
+        assert all(task.priority == TaskPriority.LOW for task in result)